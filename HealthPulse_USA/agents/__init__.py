@@ -3,26 +3,44 @@ Healthcare Article Generator - Multi-Agent System
 """
 
 from .definitions import (
+    Heading,
+    ImageSuggestion,
     TrendingTopic,
     SEOArticle,
     SEOValidation,
     ConsolidatedOutput,
     AgentOutputParser,
-    get_agent_prompts
+    StreamingSEOValidationParser,
+    get_agent_prompts,
+    get_request_templates,
+    build_agent_request,
+    get_system_message
 )
 
+from .llm_cache import LLMCache, ResultCache
+from .rate_limit import RateLimiter
+
 from .orchestrator import (
     HealthcareAgentOrchestrator,
     AgentMessage
 )
 
 __all__ = [
+    'Heading',
+    'ImageSuggestion',
     'TrendingTopic',
     'SEOArticle',
     'SEOValidation',
     'ConsolidatedOutput',
     'AgentOutputParser',
+    'StreamingSEOValidationParser',
     'get_agent_prompts',
+    'get_request_templates',
+    'build_agent_request',
+    'get_system_message',
+    'LLMCache',
+    'ResultCache',
+    'RateLimiter',
     'HealthcareAgentOrchestrator',
     'AgentMessage'
 ]
@@ -3,13 +3,27 @@ Multi-Agent System Definitions
 Implements the 4 specialized agents using AutoGen AgentChat framework
 """
 
-import asyncio
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, field
+import functools
+import re
+import sys
+import types
+from enum import IntEnum
+from typing import List, Dict, Any, Mapping, NamedTuple, Optional, Tuple
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 
 # Agent Response Data Classes
-@dataclass
+class Heading(NamedTuple):
+    """A single article heading (level is 'H2' or 'H3')"""
+    level: str
+    text: str
+
+class ImageSuggestion(NamedTuple):
+    """An image the Content Writer suggests placing in the article"""
+    description: str
+    alt_text: str
+
+@dataclass(slots=True)
 class TrendingTopic:
     """Represents a trending topic discovered by the Search Agent"""
     title: str
@@ -19,21 +33,32 @@ class TrendingTopic:
     description: str
     trending_reason: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SEOArticle:
-    """Represents an SEO-optimized article from the Content Writer"""
+    """Represents an SEO-optimized article from the Content Writer
+    
+    Immutable (sequence fields are stored as tuples) so a parsed article
+    can be shared or cached without defensive copies.
+    """
     title: str
     meta_description: str
     content: str
-    primary_keywords: List[str]
-    secondary_keywords: List[str]
-    headings: List[Dict[str, str]]
+    primary_keywords: Tuple[str, ...]
+    secondary_keywords: Tuple[str, ...]
+    headings: Tuple[Heading, ...]
     word_count: int
-    image_suggestions: List[Dict[str, str]]
-    internal_links: List[str]
-    external_links: List[str]
-
-@dataclass
+    image_suggestions: Tuple[ImageSuggestion, ...]
+    internal_links: Tuple[str, ...]
+    external_links: Tuple[str, ...]
+    
+    def __post_init__(self):
+        for name in ('primary_keywords', 'secondary_keywords', 'headings',
+                     'image_suggestions', 'internal_links', 'external_links'):
+            value = getattr(self, name)
+            if not isinstance(value, tuple):
+                object.__setattr__(self, name, tuple(value))
+
+@dataclass(slots=True)
 class SEOValidation:
     """Represents SEO validation results from the SEO Examiner"""
     overall_score: float
@@ -47,7 +72,7 @@ class SEOValidation:
     recommendations: List[str]
     pass_status: bool
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ConsolidatedOutput:
     """Final consolidated output from the Consolidator Agent"""
     article: SEOArticle
@@ -230,12 +255,12 @@ VALIDATION_CHECKLIST:
 ✓/✗ Topic matches request
 ✓/✗ Actionable content present
 ---
-PASS_STATUS: [PASS/FAIL] (Pass requires 70+ overall score)
----
 RECOMMENDATIONS:
 1. [Specific improvement suggestion]
 2. [etc.]
 ---
+PASS_STATUS: [PASS/FAIL] (Pass requires 70+ overall score)
+---
 
 Be thorough and objective in your assessment."""
 
@@ -282,14 +307,379 @@ DOWNLOAD_READY: [YES/NO]
 Ensure the final package is professional and publication-ready."""
 
 
-def get_agent_prompts() -> Dict[str, str]:
-    """Return all agent system prompts"""
-    return {
-        "search_agent": SEARCH_AGENT_PROMPT,
-        "content_writer": CONTENT_WRITER_PROMPT,
-        "seo_examiner": SEO_EXAMINER_PROMPT,
-        "consolidator": CONSOLIDATOR_PROMPT
-    }
+# Fast mode: one request plays the Search Agent, Content Writer and SEO
+# Examiner in turn and returns all three outputs as one JSON object
+MERGED_PIPELINE_PROMPT = f"""You run the whole HealthPulse USA content pipeline in a single response, acting as each of the agents below in turn. Each agent works from the output of the one before it.
+
+Respond with one JSON object with exactly these string keys:
+- "trend": the Trend Discovery Agent's findings
+- "article": the Content Writer Agent's complete article, based on that trend
+- "seo": the SEO Examiner Agent's report on that article
+
+=== TREND DISCOVERY AGENT ===
+{SEARCH_AGENT_PROMPT}
+
+=== CONTENT WRITER AGENT ===
+{CONTENT_WRITER_PROMPT}
+
+=== SEO EXAMINER AGENT ===
+{SEO_EXAMINER_PROMPT}"""
+
+
+# Built once and shared read-only, so every agent sends the identical prompt objects
+_PROMPTS = types.MappingProxyType({
+    "search_agent": sys.intern(SEARCH_AGENT_PROMPT),
+    "content_writer": sys.intern(CONTENT_WRITER_PROMPT),
+    "seo_examiner": sys.intern(SEO_EXAMINER_PROMPT),
+    "consolidator": sys.intern(CONSOLIDATOR_PROMPT),
+    "merged_pipeline": sys.intern(MERGED_PIPELINE_PROMPT)
+})
+
+
+def get_agent_prompts() -> Mapping[str, str]:
+    """Return all agent system prompts (read-only, shared across callers)"""
+    return _PROMPTS
+
+
+# Chat-completion system messages, built once per agent. The OpenAI client
+# takes message dicts rather than pre-encoded bytes, so sharing the dicts is
+# as close to a precomputed request body as the client allows.
+_SYSTEM_MESSAGES = types.MappingProxyType({
+    name: {"role": "system", "content": prompt}
+    for name, prompt in _PROMPTS.items()
+})
+
+
+def get_system_message(agent: str) -> Dict[str, str]:
+    """Return the prebuilt system message for an agent (shared; do not mutate)"""
+    return _SYSTEM_MESSAGES[agent]
+
+
+# Per-request user messages for the live pipeline. The invariant instructions
+# come first and only a short tail carries the per-request values, so provider
+# prompt caching (OpenAI automatic prefix caching, Anthropic cache_control)
+# can reuse everything before the dynamic part.
+TREND_REQUEST_STATIC = """You are a healthcare trend analyst. Find trending topics about the topic given at the end of this message.
+
+Return in this exact format:
+TOPIC TITLE: [title]
+PRIMARY KEYWORDS: [keyword1, keyword2, keyword3]
+TRENDING REASON: [why this is trending]
+SOURCE REFERENCES: [CMS, CDC, etc.]
+RELEVANCE SCORE: [number 1-100]
+BRIEF DESCRIPTION: [2-3 sentences]"""
+
+TREND_REQUEST_DYNAMIC_TEMPLATE = "Topic: {topic_query}"
+
+WRITER_REQUEST_STATIC = """Write a comprehensive SEO-optimized article about the topic given at the end of this message.
+
+Include:
+- Meta description (150-160 chars)
+- H1 title
+- Multiple H2 and H3 sections
+- At least 1500 words
+- Professional healthcare tone
+
+Format with markdown headers (## for H2, ### for H3)."""
+
+WRITER_REQUEST_DYNAMIC_TEMPLATE = """Topic: {topic_query}
+Topic details: {title}
+Keywords to use: {keywords}"""
+
+SEO_REQUEST_STATIC = """Analyze the article given at the end of this message for SEO.
+
+Provide scores (out of max) for:
+- Keyword Usage: X/20
+- Heading Structure: X/15
+- Content Length: X/15
+- Readability: X/15
+- Topic Relevance: X/15
+- Search Intent: X/10
+
+OVERALL_SCORE: X/100
+VALIDATION_CHECKLIST: one ✓ or ✗ line per checklist item
+RECOMMENDATIONS: numbered list
+PASS_STATUS: PASS or FAIL"""
+
+SEO_REQUEST_DYNAMIC_TEMPLATE = """Article:
+
+{article}"""
+
+MERGED_REQUEST_STATIC = f"""Produce all three pipeline outputs for the topic given at the end of this message.
+
+For "trend":
+{TREND_REQUEST_STATIC}
+
+For "article":
+{WRITER_REQUEST_STATIC}
+
+For "seo", analyze the article you wrote for SEO.
+
+Provide scores (out of max) for:
+- Keyword Usage: X/20
+- Heading Structure: X/15
+- Content Length: X/15
+- Readability: X/15
+- Topic Relevance: X/15
+- Search Intent: X/10
+
+OVERALL_SCORE: X/100
+VALIDATION_CHECKLIST: one ✓ or ✗ line per checklist item
+RECOMMENDATIONS: numbered list
+PASS_STATUS: PASS or FAIL"""
+
+MERGED_REQUEST_DYNAMIC_TEMPLATE = "Topic: {topic_query}"
+
+_REQUEST_TEMPLATES = types.MappingProxyType({
+    "search_agent": (TREND_REQUEST_STATIC, TREND_REQUEST_DYNAMIC_TEMPLATE),
+    "content_writer": (WRITER_REQUEST_STATIC, WRITER_REQUEST_DYNAMIC_TEMPLATE),
+    "seo_examiner": (SEO_REQUEST_STATIC, SEO_REQUEST_DYNAMIC_TEMPLATE),
+    "merged_pipeline": (MERGED_REQUEST_STATIC, MERGED_REQUEST_DYNAMIC_TEMPLATE)
+})
+
+
+def get_request_templates() -> Mapping[str, Tuple[str, str]]:
+    """Return the (static, dynamic template) user-message halves per agent"""
+    return _REQUEST_TEMPLATES
+
+
+def build_agent_request(agent: str, **values: Any) -> str:
+    """Build an agent's user message: static instructions, then the filled dynamic tail"""
+    static, dynamic = _REQUEST_TEMPLATES[agent]
+    return f"{static}\n\n{dynamic.format(**values)}"
+
+
+def _split_csv(value: str) -> List[str]:
+    """Split a comma-separated agent field into stripped, non-empty items"""
+    return list(filter(None, map(str.strip, value.split(','))))
+
+
+def _split_lines(value: str) -> List[str]:
+    """Split a multi-line agent field into its non-empty stripped lines"""
+    return list(filter(None, map(str.strip, value.split('\n'))))
+
+
+def _parse_score(value: str, default: float) -> float:
+    """Parse an 'X/Y' (or bare 'X') score, falling back to default"""
+    try:
+        return float(value.split('/')[0])
+    except ValueError:
+        return default
+
+
+# Search Agent line prefixes -> TrendingTopic field (or (field, converter))
+_TOPIC_FIELDS = {
+    'TOPIC TITLE': 'title',
+    'PRIMARY KEYWORDS': ('keywords', _split_csv),
+    'TRENDING REASON': 'trending_reason',
+    'SOURCE REFERENCES': 'source',
+    'RELEVANCE SCORE': ('relevance_score', lambda v: _parse_score(v, 75.0)),
+    'BRIEF DESCRIPTION': 'description'
+}
+
+# Content Writer section markers -> SEOArticle field (or (field, converter))
+_ARTICLE_FIELDS = {
+    'META_DESCRIPTION': 'meta_description',
+    'TITLE': 'title',
+    'PRIMARY_KEYWORDS': ('primary_keywords', _split_csv),
+    'SECONDARY_KEYWORDS': ('secondary_keywords', _split_csv),
+    'INTERNAL_LINK_SUGGESTIONS': ('internal_links', _split_lines),
+    'EXTERNAL_LINK_SUGGESTIONS': ('external_links', _split_lines)
+}
+
+# "## " and "### " heading lines with some text after the marker
+_HEADING_RE = re.compile(r'^(#{2,3}) (.*\S)', re.MULTILINE)
+
+_WORD_RE = re.compile(r'\S+')
+
+
+def _count_words(text: str) -> int:
+    """Whitespace-separated word count without building a list of words"""
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+
+def _parse_headings(text: str) -> List[Heading]:
+    """H2/H3 headings of a markdown article, in order"""
+    return [
+        Heading(f'H{len(hashes)}', heading.strip())
+        for hashes, heading in _HEADING_RE.findall(text)
+    ]
+
+
+def _set_article_content(article_data: Dict[str, Any], body: str) -> None:
+    """Store the article body along with its word count and headings"""
+    article_data['content'] = body
+    article_data['word_count'] = _count_words(body)
+    article_data['headings'] = _parse_headings(body)
+
+
+def _set_image_suggestions(article_data: Dict[str, Any], body: str) -> None:
+    """Collect '<description> | Alt-text: <alt>' lines"""
+    for line in body.split('\n'):
+        description, sep, alt_text = line.partition('|')
+        if sep:
+            label, sep, value = alt_text.partition('Alt-text:')
+            article_data['image_suggestions'].append(ImageSuggestion(
+                description.strip(), (value if sep else label).strip()
+            ))
+
+
+# Content Writer sections that fill more than one field
+_ARTICLE_SECTION_HANDLERS = {
+    'ARTICLE_CONTENT': _set_article_content,
+    'IMAGE_SUGGESTIONS': _set_image_suggestions
+}
+
+_ARTICLE_SECTIONS = '|'.join([*_ARTICLE_FIELDS, *_ARTICLE_SECTION_HANDLERS])
+
+# One sweep over the Content Writer response: each match is a section marker
+# and its body, which runs until the next marker, a '---' separator or the end
+_SECTION_RE = re.compile(
+    rf'^({_ARTICLE_SECTIONS}):(.*?)(?=^(?:{_ARTICLE_SECTIONS}):|^---[ \t]*$|\Z)',
+    re.MULTILINE | re.DOTALL
+)
+
+# Non-empty lines, yielded lazily instead of materializing response.split('\n')
+_LINE_RE = re.compile(r'[^\n]+')
+
+# Checklist pass/fail marks, found in one scan instead of three `in` checks
+_CHECK_RE = re.compile('[✓✗]')
+
+
+class _ValidationSection(IntEnum):
+    """Multi-line block of the SEO Examiner report being read"""
+    NONE = 0
+    CHECKLIST = 1
+    RECOMMENDATIONS = 2
+
+# SEO Examiner category score labels, normalized by _label -> (SEOValidation
+# field, maximum points)
+_SCORE_FIELDS = {
+    'KEYWORD_USAGE': ('keyword_score', 20.0),
+    'HEADING_STRUCTURE': ('heading_score', 15.0),
+    'CONTENT_LENGTH': ('length_score', 15.0),
+    'READABILITY': ('readability_score', 15.0),
+    'TOPIC_RELEVANCE': ('relevance_score', 15.0),
+    'SEARCH_INTENT': ('intent_score', 10.0)
+}
+
+# Labels that start a new part of the report, ending a RECOMMENDATIONS block
+_REPORT_LABELS = frozenset({
+    'OVERALL_SCORE', 'CATEGORY_SCORES', 'VALIDATION_CHECKLIST',
+    'PASS_STATUS', 'RECOMMENDATIONS', *_SCORE_FIELDS
+})
+
+# SEO Examiner reports pass at this overall score when PASS_STATUS is missing
+_PASS_SCORE = 70.0
+
+
+def _label(head: str) -> str:
+    """Normalize a report line label: '- **Overall score' -> 'OVERALL_SCORE'"""
+    return head.strip(' -*•#').upper().replace(' ', '_')
+
+
+class StreamingSEOValidationParser:
+    """Incremental SEO Examiner parser fed with response chunks as they arrive
+    
+    Complete lines are parsed as soon as they are fed, so parsing overlaps
+    with token generation. early_fail turns True once the report has given
+    an overall score below EARLY_FAIL_SCORE, declared PASS_STATUS: FAIL and
+    closed its RECOMMENDATIONS block, letting the caller stop the stream
+    early without losing the checklist or the recommendations.
+    
+    Category scores missing from the report keep their default_scores value
+    (0 when not given); a missing overall score is the sum of the category
+    scores, and a missing PASS_STATUS is decided by that overall score.
+    """
+    
+    EARLY_FAIL_SCORE = 50.0
+    
+    def __init__(self, default_scores: Optional[Mapping[str, float]] = None):
+        self._buf = ''
+        self._section = _ValidationSection.NONE
+        self._status_seen = False
+        self._overall_seen = False
+        self._recommendations_closed = False
+        self._data = {
+            'overall_score': 0.0,
+            'keyword_score': 0.0,
+            'heading_score': 0.0,
+            'length_score': 0.0,
+            'readability_score': 0.0,
+            'relevance_score': 0.0,
+            'intent_score': 0.0,
+            **(default_scores or {}),
+            'validation_checklist': {},
+            'recommendations': [],
+            'pass_status': False
+        }
+    
+    @property
+    def early_fail(self) -> bool:
+        """Whether the report has already failed at a low overall score"""
+        return (
+            self._status_seen
+            and self._overall_seen
+            and self._recommendations_closed
+            and not self._data['pass_status']
+            and self._data['overall_score'] < self.EARLY_FAIL_SCORE
+        )
+    
+    def feed(self, chunk: str) -> None:
+        """Buffer a chunk and parse every line it completes"""
+        complete, _, self._buf = (self._buf + chunk).rpartition('\n')
+        for match in _LINE_RE.finditer(complete):
+            self._handle(match.group().strip())
+    
+    def finish(self) -> SEOValidation:
+        """Parse any trailing partial line and build the SEOValidation"""
+        if self._buf:
+            self._handle(self._buf.strip())
+            self._buf = ''
+        validation_data = self._data
+        if not self._overall_seen:
+            validation_data['overall_score'] = sum(
+                validation_data[name] for name, _ in _SCORE_FIELDS.values()
+            )
+        if not self._status_seen:
+            validation_data['pass_status'] = validation_data['overall_score'] >= _PASS_SCORE
+        return SEOValidation(**validation_data)
+    
+    def _handle(self, line: str) -> None:
+        validation_data = self._data
+        head, sep, rest = line.partition(':')
+        label = _label(head) if sep else ''
+        rest = rest.strip(' *[]')
+        score_field = _SCORE_FIELDS.get(label)
+        
+        if self._section == _ValidationSection.RECOMMENDATIONS and (
+            line.startswith('---') or label in _REPORT_LABELS
+        ):
+            self._section = _ValidationSection.NONE
+            self._recommendations_closed = True
+        
+        if label == 'OVERALL_SCORE':
+            score = _parse_score(rest, -1.0)
+            if score >= 0:
+                validation_data['overall_score'] = min(score, 100.0)
+                self._overall_seen = True
+        elif score_field:
+            field_name, cap = score_field
+            validation_data[field_name] = min(_parse_score(rest, validation_data[field_name]), cap)
+        elif label == 'PASS_STATUS':
+            validation_data['pass_status'] = rest.upper().startswith('PASS')
+            self._status_seen = True
+        elif label == 'VALIDATION_CHECKLIST':
+            self._section = _ValidationSection.CHECKLIST
+        elif label == 'RECOMMENDATIONS':
+            self._section = _ValidationSection.RECOMMENDATIONS
+        elif self._section == _ValidationSection.CHECKLIST and (mark := _CHECK_RE.search(line)):
+            item_name = _CHECK_RE.sub('', line).strip()
+            validation_data['validation_checklist'][item_name] = mark.group() == '✓'
+        elif self._section == _ValidationSection.RECOMMENDATIONS and line and line[0].isdigit():
+            _, sep, rec = line.partition('.')
+            rec = rec.strip() if sep else line
+            validation_data['recommendations'].append(rec)
 
 
 class AgentOutputParser:
@@ -308,32 +698,27 @@ class AgentOutputParser:
             'trending_reason': ''
         }
         
-        current_section = None
         for line in lines:
-            line = line.strip()
-            if line.startswith('TOPIC TITLE:'):
-                topic_data['title'] = line.replace('TOPIC TITLE:', '').strip()
-            elif line.startswith('PRIMARY KEYWORDS:'):
-                keywords = line.replace('PRIMARY KEYWORDS:', '').strip()
-                topic_data['keywords'] = [k.strip() for k in keywords.split(',')]
-            elif line.startswith('TRENDING REASON:'):
-                topic_data['trending_reason'] = line.replace('TRENDING REASON:', '').strip()
-            elif line.startswith('SOURCE REFERENCES:'):
-                topic_data['source'] = line.replace('SOURCE REFERENCES:', '').strip()
-            elif line.startswith('RELEVANCE SCORE:'):
-                try:
-                    score_str = line.replace('RELEVANCE SCORE:', '').strip()
-                    topic_data['relevance_score'] = float(score_str.split('/')[0])
-                except:
-                    topic_data['relevance_score'] = 75.0
-            elif line.startswith('BRIEF DESCRIPTION:'):
-                topic_data['description'] = line.replace('BRIEF DESCRIPTION:', '').strip()
+            head, _, rest = line.strip().partition(':')
+            spec = _TOPIC_FIELDS.get(head)
+            if spec is None:
+                continue
+            if isinstance(spec, tuple):
+                field_name, convert = spec
+                topic_data[field_name] = convert(rest.strip())
+            else:
+                topic_data[spec] = rest.strip()
         
         return TrendingTopic(**topic_data)
     
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def parse_seo_article(response: str) -> SEOArticle:
-        """Parse Content Writer output into SEOArticle"""
+        """Parse Content Writer output into SEOArticle
+        
+        Memoized on the response text; SEOArticle is frozen, so the cached
+        instance is returned directly.
+        """
         article_data = {
             'title': '',
             'meta_description': '',
@@ -347,124 +732,39 @@ class AgentOutputParser:
             'external_links': []
         }
         
-        sections = response.split('---')
-        
-        for section in sections:
-            section = section.strip()
-            if section.startswith('META_DESCRIPTION:'):
-                article_data['meta_description'] = section.replace('META_DESCRIPTION:', '').strip()
-            elif section.startswith('TITLE:'):
-                article_data['title'] = section.replace('TITLE:', '').strip()
-            elif section.startswith('PRIMARY_KEYWORDS:'):
-                lines = section.split('\n')
-                for line in lines:
-                    if line.startswith('PRIMARY_KEYWORDS:'):
-                        keywords = line.replace('PRIMARY_KEYWORDS:', '').strip()
-                        article_data['primary_keywords'] = [k.strip() for k in keywords.split(',')]
-                    elif line.startswith('SECONDARY_KEYWORDS:'):
-                        keywords = line.replace('SECONDARY_KEYWORDS:', '').strip()
-                        article_data['secondary_keywords'] = [k.strip() for k in keywords.split(',')]
-            elif section.startswith('ARTICLE_CONTENT:'):
-                content = section.replace('ARTICLE_CONTENT:', '').strip()
-                article_data['content'] = content
-                article_data['word_count'] = len(content.split())
-                
-                # Extract headings
-                for line in content.split('\n'):
-                    if line.startswith('## '):
-                        article_data['headings'].append({'level': 'H2', 'text': line.replace('## ', '')})
-                    elif line.startswith('### '):
-                        article_data['headings'].append({'level': 'H3', 'text': line.replace('### ', '')})
-            elif section.startswith('IMAGE_SUGGESTIONS:'):
-                lines = section.replace('IMAGE_SUGGESTIONS:', '').strip().split('\n')
-                for line in lines:
-                    if '|' in line and line.strip():
-                        parts = line.split('|')
-                        if len(parts) >= 2:
-                            article_data['image_suggestions'].append({
-                                'description': parts[0].strip(),
-                                'alt_text': parts[1].replace('Alt-text:', '').strip()
-                            })
-            elif 'INTERNAL_LINK' in section:
-                article_data['internal_links'] = [l.strip() for l in section.split('\n') if l.strip() and not l.startswith('INTERNAL')]
-            elif 'EXTERNAL_LINK' in section:
-                article_data['external_links'] = [l.strip() for l in section.split('\n') if l.strip() and not l.startswith('EXTERNAL')]
+        for match in _SECTION_RE.finditer(response):
+            name, body = match.group(1), match.group(2).strip()
+            handler = _ARTICLE_SECTION_HANDLERS.get(name)
+            if handler:
+                handler(article_data, body)
+                continue
+            spec = _ARTICLE_FIELDS[name]
+            if isinstance(spec, tuple):
+                field_name, convert = spec
+                article_data[field_name] = convert(body)
+            else:
+                article_data[spec] = body
         
         return SEOArticle(**article_data)
     
     @staticmethod
     def parse_seo_validation(response: str) -> SEOValidation:
-        """Parse SEO Examiner output into SEOValidation"""
-        validation_data = {
-            'overall_score': 0.0,
-            'keyword_score': 0.0,
-            'heading_score': 0.0,
-            'length_score': 0.0,
-            'readability_score': 0.0,
-            'relevance_score': 0.0,
-            'intent_score': 0.0,
-            'validation_checklist': {},
-            'recommendations': [],
-            'pass_status': False
-        }
+        """Parse SEO Examiner output into SEOValidation
         
-        lines = response.split('\n')
-        in_recommendations = False
-        in_checklist = False
-        
-        for line in lines:
-            line = line.strip()
-            
-            if line.startswith('OVERALL_SCORE:'):
-                try:
-                    score_str = line.replace('OVERALL_SCORE:', '').strip()
-                    validation_data['overall_score'] = float(score_str.split('/')[0])
-                except:
-                    validation_data['overall_score'] = 75.0
-            elif 'Keyword Usage:' in line:
-                try:
-                    validation_data['keyword_score'] = float(line.split(':')[1].strip().split('/')[0])
-                except:
-                    pass
-            elif 'Heading Structure:' in line:
-                try:
-                    validation_data['heading_score'] = float(line.split(':')[1].strip().split('/')[0])
-                except:
-                    pass
-            elif 'Content Length:' in line:
-                try:
-                    validation_data['length_score'] = float(line.split(':')[1].strip().split('/')[0])
-                except:
-                    pass
-            elif 'Readability:' in line:
-                try:
-                    validation_data['readability_score'] = float(line.split(':')[1].strip().split('/')[0])
-                except:
-                    pass
-            elif 'Topic Relevance:' in line:
-                try:
-                    validation_data['relevance_score'] = float(line.split(':')[1].strip().split('/')[0])
-                except:
-                    pass
-            elif 'Search Intent:' in line:
-                try:
-                    validation_data['intent_score'] = float(line.split(':')[1].strip().split('/')[0])
-                except:
-                    pass
-            elif line.startswith('PASS_STATUS:'):
-                validation_data['pass_status'] = 'PASS' in line.upper()
-            elif line.startswith('VALIDATION_CHECKLIST:'):
-                in_checklist = True
-                in_recommendations = False
-            elif line.startswith('RECOMMENDATIONS:'):
-                in_recommendations = True
-                in_checklist = False
-            elif in_checklist and ('✓' in line or '✗' in line):
-                passed = '✓' in line
-                item_name = line.replace('✓', '').replace('✗', '').strip()
-                validation_data['validation_checklist'][item_name] = passed
-            elif in_recommendations and line and line[0].isdigit():
-                rec = line.split('.', 1)[-1].strip() if '.' in line else line
-                validation_data['recommendations'].append(rec)
-        
-        return SEOValidation(**validation_data)
+        Memoized on the response text; callers get their own copy of the
+        mutable checklist and recommendations.
+        """
+        cached = AgentOutputParser._parse_seo_validation(response)
+        return replace(
+            cached,
+            validation_checklist=dict(cached.validation_checklist),
+            recommendations=list(cached.recommendations)
+        )
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _parse_seo_validation(response: str) -> SEOValidation:
+        """Uncached SEO Examiner parse behind parse_seo_validation"""
+        parser = StreamingSEOValidationParser()
+        parser.feed(response)
+        return parser.finish()
@@ -0,0 +1,213 @@
+"""
+LLM Response Cache
+Reuses agent responses for repeated (model, messages) requests and whole
+generations for repeated topics
+"""
+
+import asyncio
+import atexit
+import hashlib
+import json
+import os
+import re
+import shelve
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+
+_TOKEN_RE = re.compile(r'\w+')
+
+
+class LLMCache:
+    """
+    In-memory cache of agent response text keyed on the full request
+    Entries expire after ttl seconds; a disabled cache never stores or hits.
+    """
+
+    def __init__(self, enabled: bool = False, ttl: float = 86400):
+        self.enabled = enabled
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[float, str]] = {}
+
+    @staticmethod
+    def make_key(model: str, messages: List[Dict[str, Any]], **params: Any) -> str:
+        """SHA-256 of the model, messages and any sampling parameters"""
+        payload = json.dumps(
+            {"model": model, "messages": messages, **params},
+            sort_keys=True,
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached response text, or None on a miss"""
+        if not self.enabled:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is None:
+            print(f"LLM cache miss: {key[:12]}")
+            return None
+
+        expires, text = entry
+        if expires < time.monotonic():
+            del self._entries[key]
+            print(f"LLM cache miss (expired): {key[:12]}")
+            return None
+
+        print(f"LLM cache hit: {key[:12]} (saved ~{len(text) // 4} tokens)")
+        return text
+
+    async def set(self, key: str, text: str, ttl: Optional[float] = None) -> None:
+        """Store response text for ttl seconds (defaults to the cache TTL)"""
+        if self.enabled:
+            self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), text)
+
+    def clear(self) -> None:
+        """Drop every cached response"""
+        self._entries.clear()
+
+
+class ResultCache:
+    """
+    LRU cache of finished generations keyed on the normalized topic
+    Topics that differ only in case, spacing or punctuation share an entry.
+    Entries expire after ttl seconds; a disabled cache never stores or hits.
+    With a directory, results are also pickled to disk and survive restarts,
+    and per-topic request counts are kept there to drive warm-up. Disk reads
+    and writes run in worker threads so they never block the event loop.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        ttl: float = 86400,
+        max_entries: int = 500,
+        directory: Optional[str] = None
+    ):
+        self.enabled = enabled
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._path = None
+        self._disk = None
+        self._disk_lock = threading.Lock()
+        self._popularity_path = None
+        self._requests: Counter = Counter()
+        if enabled and directory:
+            os.makedirs(directory, exist_ok=True)
+            self._path = os.path.join(directory, "results")
+            self._disk = shelve.open(self._path)
+            atexit.register(self._close_disk)
+            self._popularity_path = os.path.join(directory, "popularity.json")
+            try:
+                with open(self._popularity_path, encoding='utf-8') as f:
+                    self._requests.update({tuple(json.loads(k)): n for k, n in json.load(f).items()})
+            except (OSError, ValueError):
+                pass
+
+    @staticmethod
+    def make_key(model: str, topic_query: str, category_path: str, pipeline: str = "agents") -> str:
+        """Model and pipeline plus the casefolded word sequence of the topic and category
+        
+        pipeline names how the result was produced (e.g. "agents" or
+        "merged"), so different pipelines never serve each other's articles.
+        """
+        words = lambda text: ' '.join(_TOKEN_RE.findall(text.casefold()))
+        return f"{model}|{pipeline}|{words(topic_query)}|{words(category_path)}"
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached result, or None on a miss"""
+        if not self.enabled:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is None and self._disk is not None:
+            entry = await asyncio.to_thread(self._load, key)
+            if entry is not None:
+                self._remember(key, entry)
+        if entry is None:
+            return None
+
+        expires, result = entry
+        if expires < time.time():
+            self._entries.pop(key, None)
+            if self._disk is not None:
+                await asyncio.to_thread(self._discard, key, expires)
+            return None
+
+        self._entries.move_to_end(key)
+        print(f"Result cache hit: {key}")
+        return result
+
+    async def set(self, key: str, result: Any) -> None:
+        """Store a result, evicting the least recently used beyond max_entries"""
+        if not self.enabled:
+            return
+
+        entry = (time.time() + self.ttl, result)
+        self._remember(key, entry)
+        if self._disk is not None:
+            await asyncio.to_thread(self._store, key, entry)
+
+    def _remember(self, key: str, entry: Tuple[float, Any]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _load(self, key: str) -> Optional[Tuple[float, Any]]:
+        """Read an entry from disk; one that no longer unpickles is dropped as a miss"""
+        with self._disk_lock:
+            try:
+                return self._disk.get(key)
+            except Exception as e:
+                # e.g. pickled before a change to the result dataclasses
+                print(f"Dropping unreadable result cache entry {key}: {e}")
+                del self._disk[key]
+                return None
+
+    def _store(self, key: str, entry: Tuple[float, Any]) -> None:
+        with self._disk_lock:
+            self._disk[key] = entry
+            self._disk.sync()
+
+    def _discard(self, key: str, expires: float) -> None:
+        """Delete an expired entry from disk unless it was rewritten meanwhile"""
+        with self._disk_lock:
+            entry = self._disk.get(key)
+            if entry is not None and entry[0] == expires:
+                del self._disk[key]
+                self._disk.sync()
+
+    def _close_disk(self) -> None:
+        with self._disk_lock:
+            self._disk.close()
+
+    async def count_request(self, topic_query: str, category_path: str) -> None:
+        """Record one request for a topic, persisting the tally when on disk"""
+        if not self.enabled:
+            return
+
+        self._requests[(topic_query, category_path)] += 1
+        if self._popularity_path:
+            tally = {json.dumps(list(k)): n for k, n in self._requests.items()}
+            await asyncio.to_thread(self._write_popularity, tally)
+
+    def _write_popularity(self, tally: Dict[str, int]) -> None:
+        with self._disk_lock, open(self._popularity_path, 'w', encoding='utf-8') as f:
+            json.dump(tally, f)
+
+    def most_requested(self, n: int) -> List[Tuple[str, str]]:
+        """The n most requested (topic_query, category_path) pairs"""
+        return [topic for topic, _ in self._requests.most_common(n)]
+
+    def clear(self) -> None:
+        """Drop every cached result, on disk as well"""
+        self._entries.clear()
+        if self._disk is not None:
+            with self._disk_lock:
+                self._disk.clear()
+                self._disk.sync()
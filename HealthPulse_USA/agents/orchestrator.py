@@ -4,19 +4,214 @@ Implements Round-Robin orchestration using AutoGen AgentChat
 """
 
 import asyncio
+import contextlib
+import inspect
+import json
 import os
-from typing import Dict, Any, Optional, List, Callable
-from dataclasses import dataclass
-from datetime import datetime
+import re
+import time
+import traceback
+from typing import Dict, Any, Optional, List, Callable, Tuple
+from dataclasses import dataclass, replace
 
 from .definitions import (
     get_agent_prompts,
+    build_agent_request,
+    get_system_message,
     AgentOutputParser,
     TrendingTopic,
     SEOArticle,
+    Heading,
+    ImageSuggestion,
     SEOValidation,
-    ConsolidatedOutput
+    ConsolidatedOutput,
+    StreamingSEOValidationParser,
+    _count_words,
+    _parse_headings
 )
+from .llm_cache import LLMCache, ResultCache
+from .rate_limit import RateLimiter
+
+try:
+    from openai import APIConnectionError, RateLimitError
+    # APITimeoutError subclasses APIConnectionError
+    _RETRYABLE_ERRORS = (APIConnectionError, RateLimitError)
+except ImportError:
+    _RETRYABLE_ERRORS = ()
+
+
+# Shared by every orchestrator so repeat generations hit it across reruns.
+# Opt-in: repeated requests are answered from memory instead of the API.
+_RESPONSE_CACHE = LLMCache(
+    enabled=os.getenv("LLM_CACHE_ENABLED", "").lower() in ("1", "true", "yes"),
+    ttl=float(os.getenv("LLM_CACHE_TTL", "86400"))
+)
+
+# One limiter for the process: orchestrators are cached per (api_key, model,
+# fast mode), and LLM_MAX_CONCURRENCY / the per-minute limits are account-wide
+_RATE_LIMITER = RateLimiter.from_env()
+
+# Whole live generations, so a repeated topic skips every agent call;
+# set LLM_CACHE_DIR to keep them across restarts
+_RESULT_CACHE = ResultCache(
+    enabled=_RESPONSE_CACHE.enabled,
+    ttl=_RESPONSE_CACHE.ttl,
+    directory=os.getenv("LLM_CACHE_DIR") or None
+)
+
+
+# Recommendations shown when the SEO Examiner report lists none
+_SEO_DEFAULT_RECOMMENDATIONS = (
+    "Consider adding more internal links",
+    "Include additional statistics from trusted sources",
+    "Add FAQ section for featured snippets"
+)
+
+# Category scores assumed when the SEO Examiner report leaves one out; the
+# ones it gives, such as "- Keyword Usage: 17/20", are read line by line by
+# StreamingSEOValidationParser using the labels and caps in _SCORE_FIELDS
+_SEO_DEFAULT_SCORES = {
+    'keyword_score': 16.0,
+    'heading_score': 13.0,
+    'length_score': 13.0,
+    'readability_score': 12.0,
+    'relevance_score': 13.0,
+    'intent_score': 8.0
+}
+
+# First line over 50 characters mentioning "meta"; searched with endpos=500
+_META_LINE_RE = re.compile(r'^(?=[^\n]{51})[^\n]*meta[^\n]*', re.IGNORECASE | re.MULTILINE)
+
+# First "# " line, if it is one of the article's first 10 lines
+_TITLE_RE = re.compile(r'(?:[^\n]*\n){0,9}?# ([^\n]*)')
+
+def _generation_timestamp() -> str:
+    """Local ISO-8601 time with microseconds, formatted without a datetime object"""
+    now = time.time()
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(now))}.{int(now % 1 * 1_000_000):06d}"
+
+
+async def _call_back(callback: Callable, *args) -> None:
+    """Call a sync or async callback, logging rather than raising its errors"""
+    try:
+        result = callback(*args)
+        if inspect.isawaitable(result):
+            await result
+    except Exception as e:
+        print(f"Callback error: {e}")
+
+
+def _estimate_tokens(messages: List[Dict[str, Any]], max_tokens: int) -> int:
+    """Rough token budget for a call: ~4 prompt characters per token plus the completion cap"""
+    return max_tokens + sum(len(message["content"]) for message in messages) // 4
+
+
+# Demo-mode article body, formatted per topic by _generate_demo_article
+_DEMO_ARTICLE_TEMPLATE = """# Complete Guide to {topic_query}: 2025 Updates and Essential Information
+
+The landscape of US healthcare continues to evolve, and staying informed about {topic_query} is more important than ever. This comprehensive guide provides the latest information, policy updates, and expert insights to help you navigate your healthcare options effectively.
+
+## Understanding {topic_query}
+
+{topic_query} represents a critical component of the American healthcare system, affecting millions of individuals and families across the nation. As we move through 2025, significant developments have reshaped how beneficiaries access and utilize these healthcare benefits.
+
+The Centers for Medicare & Medicaid Services (CMS) has implemented several key changes that directly impact coverage options and eligibility requirements. Understanding these changes is essential for making informed healthcare decisions that protect both your health and financial well-being.
+
+### The Importance of Staying Informed
+
+Healthcare policies and regulations undergo continuous refinement. Recent data from the Kaiser Family Foundation indicates that awareness of coverage options significantly impacts health outcomes. Individuals who understand their benefits are more likely to utilize preventive services and maintain consistent care relationships with healthcare providers.
+
+## Key Benefits and Coverage
+
+When evaluating {topic_query}, understanding the full scope of available benefits helps ensure you maximize your coverage. Current benefits typically include:
+
+- **Preventive Care Services**: Annual wellness visits, screenings, and immunizations at no additional cost
+- **Hospital and Medical Services**: Coverage for inpatient and outpatient care
+- **Prescription Drug Benefits**: Access to necessary medications with varying cost-sharing structures
+- **Specialist Services**: Referrals and coverage for specialized medical care
+- **Mental Health Coverage**: Expanded mental health and substance abuse services
+
+The Department of Health and Human Services (HHS) emphasizes that comprehensive coverage reduces financial barriers to necessary medical care, leading to better health outcomes and reduced long-term healthcare costs.
+
+## Eligibility Requirements
+
+Determining eligibility for {topic_query} involves understanding specific criteria established by federal and state guidelines. Generally, eligibility considerations include:
+
+1. **Age Requirements**: Specific age thresholds may apply depending on the program
+2. **Income Guidelines**: Many programs use Federal Poverty Level (FPL) percentages as benchmarks
+3. **Residency Status**: US citizenship or qualified immigration status requirements
+4. **Employment Considerations**: Some coverage options relate to employment status
+5. **Disability Status**: Special provisions exist for individuals with qualifying disabilities
+
+## Recent Policy Updates for 2025
+
+The 2025 healthcare landscape brings several noteworthy changes:
+
+### Coverage Expansions
+
+Federal initiatives have expanded coverage options, with particular emphasis on addressing gaps in the healthcare system. The American Medical Association (AMA) reports that these expansions improve access for previously underserved populations.
+
+### Cost-Sharing Modifications
+
+Adjustments to deductibles, copayments, and coinsurance structures reflect efforts to balance affordability with sustainable healthcare financing.
+
+### New Service Categories
+
+Emerging healthcare services, including expanded telehealth options and additional preventive care benefits, reflect evolving understanding of effective healthcare delivery.
+
+## How to Enroll
+
+Enrollment in {topic_query} follows established timelines and procedures:
+
+### Open Enrollment Periods
+
+The primary enrollment window typically runs from November 1 through January 15, though specific dates may vary by program.
+
+### Special Enrollment Periods
+
+Qualifying life events trigger special enrollment opportunities outside standard windows, including:
+
+- Loss of existing coverage
+- Marriage or divorce
+- Birth or adoption of a child
+- Change in residence
+- Changes in income affecting eligibility
+
+### Enrollment Assistance
+
+Free enrollment assistance is available through:
+
+- Healthcare.gov marketplace navigators
+- Certified application counselors
+- State health insurance assistance programs (SHIP)
+- Community health centers
+
+## Frequently Asked Questions
+
+**What documents do I need to enroll?**
+Generally, you'll need proof of identity, income verification, and Social Security numbers for household members seeking coverage.
+
+**Can I change my coverage after enrolling?**
+Outside of open enrollment, changes typically require a qualifying life event.
+
+**How do I compare available plan options?**
+Healthcare.gov and state marketplace websites provide comparison tools displaying costs, coverage details, and network information.
+
+**What if I need help understanding my options?**
+Free assistance is available through official navigator programs and resources from organizations like the Kaiser Family Foundation.
+
+## Conclusion
+
+Navigating {topic_query} requires understanding current policies, eligibility requirements, and enrollment procedures. By staying informed about these essential healthcare components, you position yourself to make decisions that protect your health and financial security.
+
+As healthcare policies continue evolving, regularly reviewing your coverage options ensures your healthcare strategy aligns with your current needs.
+
+---
+
+*This article provides general information about US healthcare options. Consult with qualified professionals for guidance specific to your situation.*
+
+**Sources**: CMS, CDC, HHS, Kaiser Family Foundation, Healthcare.gov, AMA, AHA
+"""
 
 
 @dataclass
@@ -34,197 +229,664 @@ class HealthcareAgentOrchestrator:
     Uses Round-Robin strategy for agent coordination
     """
     
-    def __init__(self, api_key: str = None, model: str = "gpt-4o"):
+    # Article characters sent to the SEO Examiner
+    SEO_PREFIX_CHARS = 3000
+    
+    # Attempts per API call before a rate-limit/connection error is raised
+    MAX_RETRIES = 3
+    
+    # Prefetched trends kept waiting for a Generate click
+    MAX_PREFETCHED_TRENDS = 4
+    
+    # Idle seconds a pooled API connection stays open
+    KEEPALIVE_SECONDS = 120
+    
+    def __init__(self, api_key: str = None, model: str = "gpt-4o", merged_prompt_mode: bool = False):
         self.api_key = api_key
         self.model = model
+        # Fast mode: one merged request instead of one call per agent
+        self.merged_prompt_mode = merged_prompt_mode
         self.message_history: List[AgentMessage] = []
         self.prompts = get_agent_prompts()
         self.parser = AgentOutputParser()
         self.autogen_available = False
         self.openai_client = None
+        self.cache = _RESPONSE_CACHE
+        self.results = _RESULT_CACHE
+        self.rate_limiter = _RATE_LIMITER
+        # Prompt token usage; see prompt_cache_hit_rate
+        self.prompt_tokens = 0
+        self.cached_prompt_tokens = 0
+        # Per-user request queues and the worker task draining each one
+        self._user_queues: Dict[str, asyncio.Queue] = {}
+        self._workers: Dict[str, asyncio.Task] = {}
+        # Opt-in: start Trend Discovery while the user is still choosing
+        self.prefetch_trends = os.getenv("LLM_PREFETCH_TRENDS", "").lower() in ("1", "true", "yes")
+        self._prefetched_trends: Dict[str, asyncio.Task] = {}
         
         # Try to initialize OpenAI client for direct calls
         if api_key:
             try:
-                from openai import OpenAI
-                self.openai_client = OpenAI(api_key=api_key)
+                from openai import AsyncOpenAI
+                self.openai_client = AsyncOpenAI(api_key=api_key, http_client=self._http_client())
                 self.autogen_available = True
                 print(f"✓ OpenAI client initialized with model: {model}")
             except Exception as e:
                 print(f"OpenAI init error: {e}")
                 self.autogen_available = False
     
+    @classmethod
+    def _http_client(cls):
+        """HTTP client that keeps pooled connections alive between generations
+        
+        httpx drops idle keep-alive connections after 5 s, so the next
+        click would pay for a fresh TLS handshake to the API.
+        """
+        import httpx
+        from openai import DefaultAsyncHttpxClient
+        return DefaultAsyncHttpxClient(
+            limits=httpx.Limits(max_connections=1000, max_keepalive_connections=100,
+                                keepalive_expiry=cls.KEEPALIVE_SECONDS)
+        )
+    
     async def generate_article(
         self,
         topic_query: str,
         category_path: str,
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        user_id: Optional[str] = None,
+        stream_callback: Optional[Callable] = None
     ) -> ConsolidatedOutput:
-        """Generate an article - uses OpenAI if available, else demo mode"""
+        """Generate an article - uses OpenAI if available, else demo mode
+        
+        With a user_id, the request joins that user's queue: one user's
+        requests run in order while different users generate concurrently.
+        stream_callback, sync or async, receives each chunk of the live
+        draft as the Content Writer streams it.
+        """
+        args = (topic_query, category_path, progress_callback, stream_callback)
+        if user_id is None:
+            return await self._generate_article(*args)
+        
+        queue = self._user_queues.get(user_id)
+        if queue is None:
+            queue = self._user_queues[user_id] = asyncio.Queue()
+            self._workers[user_id] = asyncio.create_task(self._user_worker(user_id, queue))
+        
+        future = asyncio.get_running_loop().create_future()
+        queue.put_nowait((future, args))
+        return await future
+    
+    async def _user_worker(self, user_id: str, queue: asyncio.Queue):
+        """Run one user's queued requests FIFO; exits once the queue is drained
+        
+        A request whose caller has stopped waiting is skipped, and one the
+        caller abandons mid-run is cancelled, so no generation runs unseen.
+        """
+        while True:
+            future, args = await queue.get()
+            if not future.cancelled():
+                task = asyncio.create_task(self._generate_article(*args))
+                future.add_done_callback(lambda f, task=task: task.cancel() if f.cancelled() else None)
+                try:
+                    result = await task
+                except asyncio.CancelledError:
+                    if asyncio.current_task().cancelling():
+                        # Shutting down: the request dies with its worker
+                        future.cancel()
+                        raise
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+                else:
+                    if not future.done():
+                        future.set_result(result)
+            
+            if queue.empty():
+                del self._user_queues[user_id]
+                del self._workers[user_id]
+                return
+    
+    async def _generate_article(
+        self,
+        topic_query: str,
+        category_path: str,
+        progress_callback: Optional[Callable] = None,
+        stream_callback: Optional[Callable] = None
+    ) -> ConsolidatedOutput:
+        """Run one generation, falling back to demo mode on any error"""
         
         self.message_history = []
         
+        async with self._progress_events(progress_callback) as report:
+            try:
+                if self.autogen_available and self.openai_client:
+                    print("Using LIVE mode with OpenAI API")
+                    await self.results.count_request(topic_query, category_path)
+                    return await self._generate_with_openai(
+                        topic_query, category_path, report, stream_callback
+                    )
+                else:
+                    print("Using DEMO mode")
+                    return await self._generate_demo(topic_query, category_path, report)
+            except Exception as e:
+                print(f"Generation error (falling back to demo): {e}")
+                traceback.print_exc(limit=5)
+                # Fallback to demo mode on any error
+                return await self._generate_demo(topic_query, category_path, report, pace=False)
+    
+    @contextlib.asynccontextmanager
+    async def _progress_events(self, progress_callback: Optional[Callable]):
+        """Deliver progress updates from a queue instead of on the hot path
+        
+        Yields a non-blocking (message, percent) reporter, or None when there
+        is no callback. A drain task hands queued events to the callback in
+        order; async callbacks are awaited. Every queued event is delivered
+        before the block exits.
+        """
+        if progress_callback is None:
+            yield None
+            return
+        
+        events: asyncio.Queue = asyncio.Queue()
+        
+        async def drain():
+            while (event := await events.get()) is not None:
+                await _call_back(progress_callback, *event)
+        
+        drain_task = asyncio.create_task(drain())
         try:
-            if self.autogen_available and self.openai_client:
-                print("Using LIVE mode with OpenAI API")
-                return await self._generate_with_openai(topic_query, category_path, progress_callback)
-            else:
-                print("Using DEMO mode")
-                return await self._generate_demo(topic_query, category_path, progress_callback)
-        except Exception as e:
-            print(f"Generation error (falling back to demo): {e}")
-            import traceback
-            traceback.print_exc()
-            # Fallback to demo mode on any error
-            return await self._generate_demo(topic_query, category_path, progress_callback)
+            yield lambda message, percent: events.put_nowait((message, percent))
+        finally:
+            events.put_nowait(None)
+            await drain_task
+    
+    async def generate_articles_batch(
+        self,
+        queries: List[Tuple[str, str]],
+        progress_callback: Optional[Callable] = None,
+        poll_interval: float = 30.0
+    ) -> List[ConsolidatedOutput]:
+        """Generate many articles offline through the OpenAI Batch API
+        
+        Each agent stage is submitted as one batch job for every
+        (topic_query, category_path) pair, at half the per-token price of
+        live calls but with completion windows of up to 24 hours. Articles
+        whose requests fail in any stage fall back to the demo article.
+        """
+        if not (self.autogen_available and self.openai_client):
+            return [
+                await self._generate_demo(topic_query, category_path, pace=False)
+                for topic_query, category_path in queries
+            ]
+        
+        async with self._progress_events(progress_callback) as report:
+            return await self._generate_batch_with_openai(queries, report, poll_interval)
+    
+    async def _generate_batch_with_openai(
+        self,
+        queries: List[Tuple[str, str]],
+        progress_callback: Optional[Callable],
+        poll_interval: float
+    ) -> List[ConsolidatedOutput]:
+        """Stage-by-stage Batch API run behind generate_articles_batch"""
+        # Agent 1: Trend Discovery
+        if progress_callback:
+            progress_callback("Agent 1: Discovering trends (batch)...", 15)
+        trend_texts = await self._run_batch(
+            [(self._trend_messages(topic_query), 500) for topic_query, _ in queries],
+            poll_interval
+        )
+        trends = [
+            self.parser.parse_trending_topic(text) if text is not None else None
+            for text in trend_texts
+        ]
+        
+        # Agent 2: Content Writer
+        if progress_callback:
+            progress_callback("Agent 2: Writing articles (batch)...", 40)
+        pending = [i for i, trend in enumerate(trends) if trend is not None]
+        article_texts: List[Optional[str]] = [None] * len(queries)
+        written = await self._run_batch(
+            [(self._writer_messages(queries[i][0], trends[i]), 4000) for i in pending],
+            poll_interval
+        )
+        for i, text in zip(pending, written):
+            article_texts[i] = text
+        
+        # Agent 3: SEO Examiner
+        if progress_callback:
+            progress_callback("Agent 3: Validating SEO (batch)...", 70)
+        pending = [i for i, text in enumerate(article_texts) if text is not None]
+        seo_texts: List[Optional[str]] = [None] * len(queries)
+        reviewed = await self._run_batch(
+            [(self._seo_messages(article_texts[i]), 1000) for i in pending],
+            poll_interval
+        )
+        for i, text in zip(pending, reviewed):
+            seo_texts[i] = text
+        
+        # Agent 4: Consolidator
+        if progress_callback:
+            progress_callback("Agent 4: Consolidating...", 90)
+        results = []
+        for (topic_query, category_path), trend, article, seo in zip(
+            queries, trends, article_texts, seo_texts
+        ):
+            if seo is None:
+                results.append(await self._generate_demo(topic_query, category_path, pace=False))
+                continue
+            results.append(ConsolidatedOutput(
+                article=self._parse_article_content(article, topic_query, trend),
+                seo_validation=self._parse_seo_content(seo),
+                trending_topic=trend,
+                generation_timestamp=_generation_timestamp(),
+                category_path=category_path
+            ))
+        
+        if progress_callback:
+            progress_callback("Complete!", 100)
+        return results
     
     async def _generate_with_openai(
         self,
         topic_query: str,
         category_path: str,
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        stream_callback: Optional[Callable] = None
     ) -> ConsolidatedOutput:
         """Generate article using OpenAI API directly"""
         
         try:
+            result_key = self._result_key(topic_query, category_path)
+            cached = await self.results.get(result_key)
+            if cached is not None:
+                if progress_callback:
+                    progress_callback("Complete!", 100)
+                return replace(cached, generation_timestamp=_generation_timestamp())
+            
+            if self.merged_prompt_mode:
+                result = await self._generate_merged(topic_query, category_path, progress_callback)
+                await self.results.set(result_key, result)
+                return result
+            
             # Agent 1: Trend Discovery
             if progress_callback:
                 progress_callback("Agent 1: Discovering trends...", 15)
             
-            trend_prompt = f"""You are a healthcare trend analyst. Find trending topics about: {topic_query}
-
-Return in this exact format:
-TOPIC TITLE: [title]
-PRIMARY KEYWORDS: [keyword1, keyword2, keyword3]
-TRENDING REASON: [why this is trending]
-SOURCE REFERENCES: [CMS, CDC, etc.]
-RELEVANCE SCORE: [number 1-100]
-BRIEF DESCRIPTION: [2-3 sentences]"""
-
-            trend_response = self.openai_client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": self.prompts['search_agent']},
-                    {"role": "user", "content": trend_prompt}
-                ],
-                max_tokens=500
-            )
-            trend_content = trend_response.choices[0].message.content
-            trending_topic = self.parser.parse_trending_topic(trend_content)
-            
-            await asyncio.sleep(0.3)
+            trending_topic = await self._prefetched_or_discover_trend(topic_query)
             
             # Agent 2: Content Writer
             if progress_callback:
                 progress_callback("Agent 2: Writing article...", 40)
             
-            write_prompt = f"""Write a comprehensive SEO-optimized article about: {topic_query}
-
-Topic details: {trending_topic.title}
-Keywords to use: {', '.join(trending_topic.keywords)}
-
-Include:
-- Meta description (150-160 chars)
-- H1 title
-- Multiple H2 and H3 sections
-- At least 1500 words
-- Professional healthcare tone
-
-Format with markdown headers (## for H2, ### for H3)."""
-
-            write_response = self.openai_client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": self.prompts['content_writer']},
-                    {"role": "user", "content": write_prompt}
-                ],
-                max_tokens=4000
-            )
-            article_content = write_response.choices[0].message.content
-            
-            await asyncio.sleep(0.3)
-            
-            # Agent 3: SEO Examiner
-            if progress_callback:
-                progress_callback("Agent 3: Validating SEO...", 70)
-            
-            seo_prompt = f"""Analyze this article for SEO:
-
-{article_content[:3000]}
-
-Provide scores (out of max) for:
-- Keyword Usage: X/20
-- Heading Structure: X/15
-- Content Length: X/15
-- Readability: X/15
-- Topic Relevance: X/15
-- Search Intent: X/10
-
-Overall score: X/100
-PASS_STATUS: PASS or FAIL"""
-
-            seo_response = self.openai_client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": self.prompts['seo_examiner']},
-                    {"role": "user", "content": seo_prompt}
-                ],
-                max_tokens=1000
-            )
-            seo_content = seo_response.choices[0].message.content
-            
-            await asyncio.sleep(0.2)
+            # Agent 3 (SEO Examiner) only reads the first SEO_PREFIX_CHARS of
+            # the article, so start it as soon as that much has streamed in,
+            # then structure the article for the consolidator while the
+            # examiner is running
+            seo_task = None
+            parts = []
+            received = 0
+            async with asyncio.TaskGroup() as tg:
+                async for text in self._stream_article(topic_query, trending_topic):
+                    parts.append(text)
+                    received += len(text)
+                    if stream_callback:
+                        await _call_back(stream_callback, text)
+                    if seo_task is None and received >= self.SEO_PREFIX_CHARS:
+                        seo_task = self._start_seo_review(tg, ''.join(parts), progress_callback)
+                article_content = ''.join(parts)
+                if seo_task is None:
+                    seo_task = self._start_seo_review(tg, article_content, progress_callback)
+                article_task = tg.create_task(asyncio.to_thread(
+                    self._parse_article_content, article_content, topic_query, trending_topic
+                ))
+            seo_validation = seo_task.result()
+            seo_article = article_task.result()
             
             # Agent 4: Consolidator
             if progress_callback:
                 progress_callback("Agent 4: Consolidating...", 90)
             
-            # Parse the article
-            seo_article = self._parse_article_content(article_content, topic_query, trending_topic)
-            seo_validation = self._parse_seo_content(seo_content)
-            
             if progress_callback:
                 progress_callback("Complete!", 100)
             
-            return ConsolidatedOutput(
+            result = ConsolidatedOutput(
                 article=seo_article,
                 seo_validation=seo_validation,
                 trending_topic=trending_topic,
-                generation_timestamp=datetime.now().isoformat(),
+                generation_timestamp=_generation_timestamp(),
                 category_path=category_path
             )
+            await self.results.set(result_key, result)
+            return result
             
         except Exception as e:
             print(f"OpenAI generation error: {e}")
-            return await self._generate_demo(topic_query, category_path, progress_callback)
+            return await self._generate_demo(topic_query, category_path, progress_callback, pace=False)
+    
+    def _record_usage(self, usage) -> None:
+        """Tally prompt tokens and how many were served from OpenAI's prompt cache"""
+        if usage is None:
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        self.prompt_tokens += usage.prompt_tokens
+        self.cached_prompt_tokens += getattr(details, "cached_tokens", 0) or 0
+    
+    @property
+    def prompt_cache_hit_rate(self) -> float:
+        """Share of prompt tokens OpenAI served from its prefix cache"""
+        return self.cached_prompt_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+    
+    def _trend_messages(self, topic_query: str) -> List[Dict[str, Any]]:
+        """Chat messages for the Search Agent"""
+        return [
+            get_system_message('search_agent'),
+            {"role": "user", "content": build_agent_request('search_agent', topic_query=topic_query)}
+        ]
+    
+    def _writer_messages(self, topic_query: str, trending_topic: TrendingTopic) -> List[Dict[str, Any]]:
+        """Chat messages for the Content Writer"""
+        write_prompt = build_agent_request(
+            'content_writer',
+            topic_query=topic_query,
+            title=trending_topic.title,
+            keywords=', '.join(trending_topic.keywords)
+        )
+        return [
+            get_system_message('content_writer'),
+            {"role": "user", "content": write_prompt}
+        ]
+    
+    def _seo_messages(self, article_content: str) -> List[Dict[str, Any]]:
+        """Chat messages for the SEO Examiner, which sees the article prefix only"""
+        seo_prompt = build_agent_request(
+            'seo_examiner', article=article_content[:self.SEO_PREFIX_CHARS]
+        )
+        return [
+            get_system_message('seo_examiner'),
+            {"role": "user", "content": seo_prompt}
+        ]
+    
+    async def _create_completion(self, **params):
+        """chat.completions.create, retried with exponential backoff
+        
+        Rate-limit (429) and connection errors are retried up to MAX_RETRIES
+        attempts in total, waiting 1s, 2s, ... between them; anything else
+        is raised at once.
+        """
+        for attempt in range(self.MAX_RETRIES):
+            try:
+                return await self.openai_client.chat.completions.create(**params)
+            except _RETRYABLE_ERRORS as e:
+                if attempt == self.MAX_RETRIES - 1:
+                    raise
+                delay = 2 ** attempt
+                print(f"OpenAI call failed ({type(e).__name__}), retrying in {delay}s")
+                await asyncio.sleep(delay)
+    
+    async def _generate_merged(
+        self,
+        topic_query: str,
+        category_path: str,
+        progress_callback: Optional[Callable] = None
+    ) -> ConsolidatedOutput:
+        """Fast mode: get trend, article and SEO report from one JSON response"""
+        if progress_callback:
+            progress_callback("Agent 2: Writing article...", 40)
+        
+        messages = [
+            get_system_message('merged_pipeline'),
+            {"role": "user", "content": build_agent_request('merged_pipeline', topic_query=topic_query)}
+        ]
+        cache_key = self.cache.make_key(self.model, messages, max_tokens=6000)
+        merged_content = await self.cache.get(cache_key)
+        if merged_content is None:
+            async with self.rate_limiter.limit(_estimate_tokens(messages, 6000)):
+                merged_response = await self._create_completion(
+                    model=self.model,
+                    messages=messages,
+                    max_tokens=6000,
+                    response_format={"type": "json_object"}
+                )
+            self._record_usage(merged_response.usage)
+            merged_content = merged_response.choices[0].message.content
+        outputs = json.loads(merged_content)
+        await self.cache.set(cache_key, merged_content)
+        
+        if progress_callback:
+            progress_callback("Agent 4: Consolidating...", 90)
+        
+        trending_topic = self.parser.parse_trending_topic(outputs["trend"])
+        seo_article = self._parse_article_content(outputs["article"], topic_query, trending_topic)
+        seo_validation = self._parse_seo_content(outputs["seo"])
+        
+        if progress_callback:
+            progress_callback("Complete!", 100)
+        
+        return ConsolidatedOutput(
+            article=seo_article,
+            seo_validation=seo_validation,
+            trending_topic=trending_topic,
+            generation_timestamp=_generation_timestamp(),
+            category_path=category_path
+        )
+    
+    async def _discover_trend(self, topic_query: str) -> TrendingTopic:
+        """Agent 1: ask the Search Agent for the trending angle on a topic"""
+        messages = self._trend_messages(topic_query)
+        
+        cache_key = self.cache.make_key(self.model, messages, max_tokens=500)
+        trend_content = await self.cache.get(cache_key)
+        if trend_content is None:
+            async with self.rate_limiter.limit(_estimate_tokens(messages, 500)):
+                trend_response = await self._create_completion(
+                    model=self.model,
+                    messages=messages,
+                    max_tokens=500
+                )
+            self._record_usage(trend_response.usage)
+            trend_content = trend_response.choices[0].message.content
+            await self.cache.set(cache_key, trend_content)
+        return self.parser.parse_trending_topic(trend_content)
+    
+    async def prefetch_trend(self, topic_query: str) -> None:
+        """Start Agent 1 for a topic in the background, ahead of a Generate click
+        
+        No-op unless prefetch_trends is set and the client is live. Only the
+        newest MAX_PREFETCHED_TRENDS topics are kept; older ones are cancelled.
+        """
+        if (not self.prefetch_trends or not self.openai_client
+                or self.merged_prompt_mode or topic_query in self._prefetched_trends):
+            return
+        
+        self._prefetched_trends[topic_query] = asyncio.create_task(self._discover_trend(topic_query))
+        while len(self._prefetched_trends) > self.MAX_PREFETCHED_TRENDS:
+            stale = next(iter(self._prefetched_trends))
+            self._prefetched_trends.pop(stale).cancel()
+    
+    def _result_key(self, topic_query: str, category_path: str) -> str:
+        """Result cache key for a topic under this orchestrator's model and pipeline"""
+        pipeline = "merged" if self.merged_prompt_mode else "agents"
+        return self.results.make_key(self.model, topic_query, category_path, pipeline)
+    
+    async def warm_results(self, limit: int) -> int:
+        """Generate the most requested topics not already in the result cache
+        
+        Runs them one at a time so it never competes with more than one
+        slot of user traffic. Returns how many were generated live and
+        stored; a topic that fell back to demo content is not counted.
+        """
+        if not self.results.enabled or not self.openai_client:
+            return 0
+        
+        warmed = 0
+        for topic_query, category_path in self.results.most_requested(limit):
+            key = self._result_key(topic_query, category_path)
+            if await self.results.get(key) is not None:
+                continue
+            print(f"Warming result cache: {topic_query}")
+            await self._generate_with_openai(topic_query, category_path)
+            # Only a live result is written to the cache, so that is the test
+            if await self.results.get(key) is not None:
+                warmed += 1
+        return warmed
+    
+    async def _prefetched_or_discover_trend(self, topic_query: str) -> TrendingTopic:
+        """Agent 1 result, taken from a prefetch for this topic when one exists"""
+        task = self._prefetched_trends.pop(topic_query, None)
+        if task is not None:
+            try:
+                return await task
+            except Exception as e:
+                print(f"Trend prefetch failed, retrying: {e}")
+        return await self._discover_trend(topic_query)
+    
+    async def _stream_article(self, topic_query: str, trending_topic: TrendingTopic):
+        """Agent 2: stream the Content Writer's draft for a trend
+        
+        The draft is built around the discovered title and keywords, so it
+        cannot start until _discover_trend has returned. Yields text deltas
+        as they arrive, or the whole cached draft at once.
+        """
+        messages = self._writer_messages(topic_query, trending_topic)
+        
+        cache_key = self.cache.make_key(self.model, messages, max_tokens=4000)
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+        
+        parts = []
+        async with self.rate_limiter.limit(_estimate_tokens(messages, 4000)):
+            stream = await self._create_completion(
+                model=self.model,
+                messages=messages,
+                max_tokens=4000,
+                stream=True,
+                stream_options={"include_usage": True}
+            )
+            async for chunk in stream:
+                if chunk.usage:
+                    self._record_usage(chunk.usage)
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+                    yield parts[-1]
+        await self.cache.set(cache_key, "".join(parts))
+    
+    def _start_seo_review(
+        self,
+        tg: asyncio.TaskGroup,
+        article_content: str,
+        progress_callback: Optional[Callable] = None
+    ) -> asyncio.Task:
+        """Agent 3: schedule the SEO Examiner on the article prefix"""
+        if progress_callback:
+            progress_callback("Agent 3: Validating SEO...", 70)
+        
+        return tg.create_task(self._stream_seo_review(article_content))
+    
+    async def _stream_seo_review(self, article_content: str) -> SEOValidation:
+        """Stream and parse the SEO Examiner report, stopping once it has clearly failed"""
+        messages = self._seo_messages(article_content)
+        
+        cache_key = self.cache.make_key(self.model, messages, max_tokens=1000)
+        cached = await self.cache.get(cache_key)
+        if cached is not None:
+            return self._parse_seo_content(cached)
+        
+        review = StreamingSEOValidationParser(_SEO_DEFAULT_SCORES)
+        parts = []
+        async with self.rate_limiter.limit(_estimate_tokens(messages, 1000)):
+            stream = await self._create_completion(
+                model=self.model,
+                messages=messages,
+                max_tokens=1000,
+                stream=True,
+                stream_options={"include_usage": True}
+            )
+            async for chunk in stream:
+                if chunk.usage:
+                    self._record_usage(chunk.usage)
+                if not chunk.choices:
+                    continue
+                text = chunk.choices[0].delta.content or ""
+                parts.append(text)
+                review.feed(text)
+                if review.early_fail:
+                    await stream.close()
+                    return self._finish_seo_validation(review.finish())
+        
+        await self.cache.set(cache_key, "".join(parts))
+        return self._finish_seo_validation(review.finish())
+    
+    async def _run_batch(
+        self,
+        requests: List[Tuple[List[Dict[str, Any]], int]],
+        poll_interval: float
+    ) -> List[Optional[str]]:
+        """Run (messages, max_tokens) chat requests as one Batch API job
+        
+        Returns the response text per request, in order; None where the
+        request failed or the job ended without output.
+        """
+        if not requests:
+            return []
+        
+        lines = [
+            json.dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {"model": self.model, "messages": messages, "max_tokens": max_tokens}
+            })
+            for i, (messages, max_tokens) in enumerate(requests)
+        ]
+        batch_file = await self.openai_client.files.create(
+            file=("agent_batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = await self.openai_client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(poll_interval)
+            batch = await self.openai_client.batches.retrieve(batch.id)
+        
+        texts: List[Optional[str]] = [None] * len(requests)
+        if not batch.output_file_id:
+            print(f"Batch {batch.id} ended with status {batch.status} and no output")
+            return texts
+        
+        output = await self.openai_client.files.content(batch.output_file_id)
+        for line in output.text.splitlines():
+            if not line:
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") == 200:
+                texts[int(record["custom_id"])] = response["body"]["choices"][0]["message"]["content"]
+        return texts
     
     def _parse_article_content(self, content: str, topic_query: str, trending_topic: TrendingTopic) -> SEOArticle:
         """Parse article content into SEOArticle structure"""
         
         # Extract meta description
         meta_desc = f"Comprehensive guide to {topic_query}. Latest updates, expert insights, and actionable information for 2025."
-        if "meta" in content.lower()[:500]:
-            lines = content[:500].split('\n')
-            for line in lines:
-                if "meta" in line.lower() and len(line) > 50:
-                    meta_desc = line.replace("Meta Description:", "").replace("META:", "").strip()[:160]
-                    break
-        
-        # Extract title
+        meta_match = _META_LINE_RE.search(content, 0, 500)
+        if meta_match:
+            meta_desc = meta_match.group().replace("Meta Description:", "").replace("META:", "").strip()[:160]
+        
+        # Extract title (an H1 within the first 10 lines)
         title = f"Complete Guide to {topic_query}: 2025 Updates"
-        lines = content.split('\n')
-        for line in lines[:10]:
-            if line.startswith('# '):
-                title = line[2:].strip()
-                break
+        title_match = _TITLE_RE.match(content)
+        if title_match:
+            title = title_match.group(1).strip()
         
         # Extract headings
-        headings = []
-        for line in lines:
-            if line.startswith('## '):
-                headings.append({"level": "H2", "text": line[3:].strip()})
-            elif line.startswith('### '):
-                headings.append({"level": "H3", "text": line[4:].strip()})
+        headings = _parse_headings(content)
         
         return SEOArticle(
             title=title,
@@ -233,103 +895,45 @@ PASS_STATUS: PASS or FAIL"""
             primary_keywords=trending_topic.keywords[:3] if trending_topic.keywords else [topic_query.lower()],
             secondary_keywords=trending_topic.keywords[3:] if len(trending_topic.keywords) > 3 else ["healthcare", "2025"],
             headings=headings,
-            word_count=len(content.split()),
+            word_count=_count_words(content),
             image_suggestions=[
-                {"description": f"Infographic about {topic_query}", "alt_text": f"{topic_query} overview infographic"},
-                {"description": "Healthcare professional consultation", "alt_text": "Doctor discussing healthcare options"},
-                {"description": "Coverage comparison chart", "alt_text": f"{topic_query} benefits comparison"}
+                ImageSuggestion(f"Infographic about {topic_query}", f"{topic_query} overview infographic"),
+                ImageSuggestion("Healthcare professional consultation", "Doctor discussing healthcare options"),
+                ImageSuggestion("Coverage comparison chart", f"{topic_query} benefits comparison")
             ],
             internal_links=["Medicare Guide", "Medicaid Overview", "ACA Marketplace"],
             external_links=["healthcare.gov", "cms.gov", "kff.org"]
         )
     
     def _parse_seo_content(self, content: str) -> SEOValidation:
-        """Parse SEO validation content"""
-        
-        # Default scores
-        keyword_score = 16.0
-        heading_score = 13.0
-        length_score = 13.0
-        readability_score = 12.0
-        relevance_score = 13.0
-        intent_score = 8.0
-        
-        # Try to extract scores from content
-        lines = content.split('\n')
-        for line in lines:
-            line_lower = line.lower()
-            if 'keyword' in line_lower and '/' in line:
-                try:
-                    score = float(line.split(':')[-1].strip().split('/')[0])
-                    keyword_score = min(score, 20)
-                except: pass
-            elif 'heading' in line_lower and '/' in line:
-                try:
-                    score = float(line.split(':')[-1].strip().split('/')[0])
-                    heading_score = min(score, 15)
-                except: pass
-            elif 'length' in line_lower and '/' in line:
-                try:
-                    score = float(line.split(':')[-1].strip().split('/')[0])
-                    length_score = min(score, 15)
-                except: pass
-            elif 'readability' in line_lower and '/' in line:
-                try:
-                    score = float(line.split(':')[-1].strip().split('/')[0])
-                    readability_score = min(score, 15)
-                except: pass
-            elif 'relevance' in line_lower and '/' in line:
-                try:
-                    score = float(line.split(':')[-1].strip().split('/')[0])
-                    relevance_score = min(score, 15)
-                except: pass
-            elif 'intent' in line_lower and '/' in line:
-                try:
-                    score = float(line.split(':')[-1].strip().split('/')[0])
-                    intent_score = min(score, 10)
-                except: pass
-        
-        overall = keyword_score + heading_score + length_score + readability_score + relevance_score + intent_score
-        
-        return SEOValidation(
-            overall_score=overall,
-            keyword_score=keyword_score,
-            heading_score=heading_score,
-            length_score=length_score,
-            readability_score=readability_score,
-            relevance_score=relevance_score,
-            intent_score=intent_score,
-            validation_checklist={
-                "Primary keyword in title": True,
-                "Primary keyword in first paragraph": True,
-                "Single H1 present": True,
-                "5+ H2 headings": True,
-                "Meta description optimized": True,
-                "Word count >= 1500": True,
-                "Keyword density 1-3%": True,
-                "Proper heading hierarchy": True,
-                "Topic matches request": True,
-                "Actionable content present": True
-            },
-            recommendations=[
-                "Consider adding more internal links",
-                "Include additional statistics from trusted sources",
-                "Add FAQ section for featured snippets"
-            ],
-            pass_status=overall >= 70
-        )
+        """Parse a complete SEO Examiner report"""
+        review = StreamingSEOValidationParser(_SEO_DEFAULT_SCORES)
+        review.feed(content)
+        return self._finish_seo_validation(review.finish())
+    
+    def _finish_seo_validation(self, parsed: SEOValidation) -> SEOValidation:
+        """Keep the report's own checklist, with stock recommendations if it gave none"""
+        if parsed.recommendations:
+            return parsed
+        return replace(parsed, recommendations=list(_SEO_DEFAULT_RECOMMENDATIONS))
     
     async def _generate_demo(
         self,
         topic_query: str,
         category_path: str,
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        pace: bool = True
     ) -> ConsolidatedOutput:
-        """Generate demo article without API"""
+        """Generate demo article without API
+        
+        pace spaces out the progress steps like a live run; error fallbacks
+        pass pace=False so the replacement article is returned at once.
+        """
         
         if progress_callback:
             progress_callback("Agent 1: Discovering trends...", 20)
-        await asyncio.sleep(0.4)
+        if pace:
+            await asyncio.sleep(0.4)
         
         trending_topic = TrendingTopic(
             title=f"Latest Updates in {topic_query}: What You Need to Know in 2025",
@@ -342,7 +946,8 @@ PASS_STATUS: PASS or FAIL"""
         
         if progress_callback:
             progress_callback("Agent 2: Writing article...", 50)
-        await asyncio.sleep(0.4)
+        if pace:
+            await asyncio.sleep(0.4)
         
         article_content = self._generate_demo_article(topic_query, category_path)
         
@@ -353,18 +958,18 @@ PASS_STATUS: PASS or FAIL"""
             primary_keywords=[topic_query.lower(), "healthcare", "insurance"],
             secondary_keywords=["coverage", "benefits", "eligibility", "enrollment", "2025"],
             headings=[
-                {"level": "H2", "text": f"Understanding {topic_query}"},
-                {"level": "H2", "text": "Key Benefits and Coverage"},
-                {"level": "H2", "text": "Eligibility Requirements"},
-                {"level": "H2", "text": "Recent Policy Updates for 2025"},
-                {"level": "H2", "text": "How to Enroll"},
-                {"level": "H2", "text": "Frequently Asked Questions"}
+                Heading("H2", f"Understanding {topic_query}"),
+                Heading("H2", "Key Benefits and Coverage"),
+                Heading("H2", "Eligibility Requirements"),
+                Heading("H2", "Recent Policy Updates for 2025"),
+                Heading("H2", "How to Enroll"),
+                Heading("H2", "Frequently Asked Questions")
             ],
-            word_count=len(article_content.split()),
+            word_count=_count_words(article_content),
             image_suggestions=[
-                {"description": "Infographic showing coverage options", "alt_text": f"{topic_query} coverage comparison chart"},
-                {"description": "Healthcare professional with patient", "alt_text": "Doctor consultation for healthcare benefits"},
-                {"description": "Enrollment timeline graphic", "alt_text": "Key enrollment dates for 2025"}
+                ImageSuggestion("Infographic showing coverage options", f"{topic_query} coverage comparison chart"),
+                ImageSuggestion("Healthcare professional with patient", "Doctor consultation for healthcare benefits"),
+                ImageSuggestion("Enrollment timeline graphic", "Key enrollment dates for 2025")
             ],
             internal_links=["Medicare Overview", "Medicaid Basics", "ACA Marketplace Guide"],
             external_links=["healthcare.gov", "cms.gov", "kff.org"]
@@ -372,7 +977,8 @@ PASS_STATUS: PASS or FAIL"""
         
         if progress_callback:
             progress_callback("Agent 3: Validating SEO...", 75)
-        await asyncio.sleep(0.3)
+        if pace:
+            await asyncio.sleep(0.3)
         
         seo_validation = SEOValidation(
             overall_score=84.5,
@@ -404,7 +1010,8 @@ PASS_STATUS: PASS or FAIL"""
         
         if progress_callback:
             progress_callback("Agent 4: Consolidating...", 95)
-        await asyncio.sleep(0.2)
+        if pace:
+            await asyncio.sleep(0.2)
         
         if progress_callback:
             progress_callback("Complete!", 100)
@@ -413,117 +1020,13 @@ PASS_STATUS: PASS or FAIL"""
             article=seo_article,
             seo_validation=seo_validation,
             trending_topic=trending_topic,
-            generation_timestamp=datetime.now().isoformat(),
+            generation_timestamp=_generation_timestamp(),
             category_path=category_path
         )
     
     def _generate_demo_article(self, topic_query: str, category_path: str) -> str:
         """Generate demo article content"""
-        return f"""# Complete Guide to {topic_query}: 2025 Updates and Essential Information
-
-The landscape of US healthcare continues to evolve, and staying informed about {topic_query} is more important than ever. This comprehensive guide provides the latest information, policy updates, and expert insights to help you navigate your healthcare options effectively.
-
-## Understanding {topic_query}
-
-{topic_query} represents a critical component of the American healthcare system, affecting millions of individuals and families across the nation. As we move through 2025, significant developments have reshaped how beneficiaries access and utilize these healthcare benefits.
-
-The Centers for Medicare & Medicaid Services (CMS) has implemented several key changes that directly impact coverage options and eligibility requirements. Understanding these changes is essential for making informed healthcare decisions that protect both your health and financial well-being.
-
-### The Importance of Staying Informed
-
-Healthcare policies and regulations undergo continuous refinement. Recent data from the Kaiser Family Foundation indicates that awareness of coverage options significantly impacts health outcomes. Individuals who understand their benefits are more likely to utilize preventive services and maintain consistent care relationships with healthcare providers.
-
-## Key Benefits and Coverage
-
-When evaluating {topic_query}, understanding the full scope of available benefits helps ensure you maximize your coverage. Current benefits typically include:
-
-- **Preventive Care Services**: Annual wellness visits, screenings, and immunizations at no additional cost
-- **Hospital and Medical Services**: Coverage for inpatient and outpatient care
-- **Prescription Drug Benefits**: Access to necessary medications with varying cost-sharing structures
-- **Specialist Services**: Referrals and coverage for specialized medical care
-- **Mental Health Coverage**: Expanded mental health and substance abuse services
-
-The Department of Health and Human Services (HHS) emphasizes that comprehensive coverage reduces financial barriers to necessary medical care, leading to better health outcomes and reduced long-term healthcare costs.
-
-## Eligibility Requirements
-
-Determining eligibility for {topic_query} involves understanding specific criteria established by federal and state guidelines. Generally, eligibility considerations include:
-
-1. **Age Requirements**: Specific age thresholds may apply depending on the program
-2. **Income Guidelines**: Many programs use Federal Poverty Level (FPL) percentages as benchmarks
-3. **Residency Status**: US citizenship or qualified immigration status requirements
-4. **Employment Considerations**: Some coverage options relate to employment status
-5. **Disability Status**: Special provisions exist for individuals with qualifying disabilities
-
-## Recent Policy Updates for 2025
-
-The 2025 healthcare landscape brings several noteworthy changes:
-
-### Coverage Expansions
-
-Federal initiatives have expanded coverage options, with particular emphasis on addressing gaps in the healthcare system. The American Medical Association (AMA) reports that these expansions improve access for previously underserved populations.
-
-### Cost-Sharing Modifications
-
-Adjustments to deductibles, copayments, and coinsurance structures reflect efforts to balance affordability with sustainable healthcare financing.
-
-### New Service Categories
-
-Emerging healthcare services, including expanded telehealth options and additional preventive care benefits, reflect evolving understanding of effective healthcare delivery.
-
-## How to Enroll
-
-Enrollment in {topic_query} follows established timelines and procedures:
-
-### Open Enrollment Periods
-
-The primary enrollment window typically runs from November 1 through January 15, though specific dates may vary by program.
-
-### Special Enrollment Periods
-
-Qualifying life events trigger special enrollment opportunities outside standard windows, including:
-
-- Loss of existing coverage
-- Marriage or divorce
-- Birth or adoption of a child
-- Change in residence
-- Changes in income affecting eligibility
-
-### Enrollment Assistance
-
-Free enrollment assistance is available through:
-
-- Healthcare.gov marketplace navigators
-- Certified application counselors
-- State health insurance assistance programs (SHIP)
-- Community health centers
-
-## Frequently Asked Questions
-
-**What documents do I need to enroll?**
-Generally, you'll need proof of identity, income verification, and Social Security numbers for household members seeking coverage.
-
-**Can I change my coverage after enrolling?**
-Outside of open enrollment, changes typically require a qualifying life event.
-
-**How do I compare available plan options?**
-Healthcare.gov and state marketplace websites provide comparison tools displaying costs, coverage details, and network information.
-
-**What if I need help understanding my options?**
-Free assistance is available through official navigator programs and resources from organizations like the Kaiser Family Foundation.
-
-## Conclusion
-
-Navigating {topic_query} requires understanding current policies, eligibility requirements, and enrollment procedures. By staying informed about these essential healthcare components, you position yourself to make decisions that protect your health and financial security.
-
-As healthcare policies continue evolving, regularly reviewing your coverage options ensures your healthcare strategy aligns with your current needs.
-
----
-
-*This article provides general information about US healthcare options. Consult with qualified professionals for guidance specific to your situation.*
-
-**Sources**: CMS, CDC, HHS, Kaiser Family Foundation, Healthcare.gov, AMA, AHA
-"""
+        return _DEMO_ARTICLE_TEMPLATE.format_map({"topic_query": topic_query, "category_path": category_path})
     
     def get_message_history(self) -> List[AgentMessage]:
         """Get the message history from the last generation"""
@@ -531,4 +1034,20 @@ As healthcare policies continue evolving, regularly reviewing your coverage opti
     
     async def close(self):
         """Clean up resources"""
+        workers = list(self._workers.values())
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        # Requests still queued behind a worker would otherwise wait forever
+        for queue in self._user_queues.values():
+            while not queue.empty():
+                future, _ = queue.get_nowait()
+                future.cancel()
+        self._user_queues.clear()
+        self._workers.clear()
+        for task in self._prefetched_trends.values():
+            task.cancel()
+        self._prefetched_trends.clear()
+        if self.openai_client is not None:
+            await self.openai_client.close()
         self.openai_client = None
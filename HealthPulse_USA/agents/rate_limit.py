@@ -0,0 +1,77 @@
+"""
+API Rate Limiting
+Caps in-flight agent calls and paces them to the account's rate limits
+"""
+
+import asyncio
+import contextlib
+import os
+import time
+from typing import AsyncIterator, Optional
+
+
+class _TokenBucket:
+    """Capacity that refills continuously at a per-minute rate"""
+
+    def __init__(self, per_minute: float):
+        self.per_minute = per_minute
+        self.available = per_minute
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.available = min(
+            self.per_minute,
+            self.available + (now - self._updated) * self.per_minute / 60
+        )
+        self._updated = now
+
+    async def take(self, amount: float) -> None:
+        """Wait until amount is available, then consume it"""
+        # A single request larger than the whole bucket would wait forever
+        amount = min(amount, self.per_minute)
+        while True:
+            self._refill()
+            if self.available >= amount:
+                self.available -= amount
+                return
+            await asyncio.sleep((amount - self.available) * 60 / self.per_minute)
+
+
+class RateLimiter:
+    """
+    Semaphore-gated concurrency with optional request and token buckets
+    Unset per-minute limits are not enforced; only concurrency is capped.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None
+    ):
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._requests = _TokenBucket(requests_per_minute) if requests_per_minute else None
+        self._tokens = _TokenBucket(tokens_per_minute) if tokens_per_minute else None
+
+    @classmethod
+    def from_env(cls) -> "RateLimiter":
+        """Build a limiter from LLM_MAX_CONCURRENCY / LLM_REQUESTS_PER_MINUTE / LLM_TOKENS_PER_MINUTE"""
+        rpm = os.getenv("LLM_REQUESTS_PER_MINUTE")
+        tpm = os.getenv("LLM_TOKENS_PER_MINUTE")
+        return cls(
+            max_concurrency=int(os.getenv("LLM_MAX_CONCURRENCY", "8")),
+            requests_per_minute=float(rpm) if rpm else None,
+            tokens_per_minute=float(tpm) if tpm else None
+        )
+
+    @contextlib.asynccontextmanager
+    async def limit(self, tokens: int = 0) -> AsyncIterator[None]:
+        """Hold a concurrency slot for one call expected to use about tokens"""
+        async with self._semaphore:
+            if self._requests:
+                await self._requests.take(1)
+            if self._tokens and tokens:
+                await self._tokens.take(tokens)
+            yield
@@ -5,15 +5,22 @@ Version: 9.0.0 - Logo, Trending Ticker & Article Images
 
 import streamlit as st
 import asyncio
+import html
 import os
+import queue
 import sys
+import threading
+import time
+import traceback
+import uuid
 from datetime import datetime
+from itertools import chain, islice
 import random
 
 try:
     from dotenv import load_dotenv
     load_dotenv()
-except:
+except ImportError:
     pass
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -22,11 +29,15 @@ from config import (
     get_main_categories, get_subcategories, get_specific_topics,
     build_topic_query, get_search_keywords
 )
-from agents import HealthcareAgentOrchestrator
-from utils import ArticleExporter, get_download_filename
 
 st.set_page_config(page_title="HealthPulse USA", page_icon="🏥", layout="wide", initial_sidebar_state="collapsed")
 
+# The topic hierarchy is static, so memoize the lookups made on every rerun
+cached_main_categories = st.cache_data(show_spinner=False)(get_main_categories)
+cached_subcategories = st.cache_data(show_spinner=False)(get_subcategories)
+cached_specific_topics = st.cache_data(show_spinner=False)(get_specific_topics)
+cached_topic_query = st.cache_data(show_spinner=False)(build_topic_query)
+
 # Trending healthcare topics (rotates)
 TRENDING_TOPICS = [
     "🔥 Medicare 2025 Premium Changes",
@@ -46,8 +57,12 @@ TRENDING_TOPICS = [
     "🧬 Gene Therapy Approvals 2025",
 ]
 
-# CSS Styles with Logo, Ticker & Image Styles
-st.markdown("""
+# Ticker content, duplicated for a seamless scrolling loop
+_TICKER_HTML = "".join(f'<span class="ticker-item">{t}</span>' for t in TRENDING_TOPICS) * 2
+
+# CSS Styles with Logo, Ticker & Image Styles, plus an early connection to
+# the article image CDN so the image doesn't wait on DNS/TLS after generation
+_CSS = """
 <style>
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&family=Poppins:wght@700;800&display=swap');
     
@@ -479,81 +494,180 @@ st.markdown("""
         50% { transform: translateY(-10px); }
     }
 </style>
-""", unsafe_allow_html=True)
+<link rel="preconnect" href="https://images.unsplash.com">
+"""
+
+# Injected on every run: Streamlit rebuilds the page from each script run,
+# so skipping this on a rerun would leave the page unstyled
+st.markdown(_CSS, unsafe_allow_html=True)
 
 # Healthcare stock images (royalty-free placeholders)
 HEALTHCARE_IMAGES = {
     "medicare": [
-        ("https://images.unsplash.com/photo-1576091160550-2173dba999ef?w=600", "Senior patient consulting with healthcare provider", "Unsplash"),
-        ("https://images.unsplash.com/photo-1559757148-5c350d0d3c56?w=600", "Medical professional reviewing patient records", "Unsplash"),
+        ("https://images.unsplash.com/photo-1576091160550-2173dba999ef?w=600&q=60&auto=format", "Senior patient consulting with healthcare provider", "Unsplash"),
+        ("https://images.unsplash.com/photo-1559757148-5c350d0d3c56?w=600&q=60&auto=format", "Medical professional reviewing patient records", "Unsplash"),
     ],
     "medicaid": [
-        ("https://images.unsplash.com/photo-1538108149393-fbbd81895907?w=600", "Community health clinic serving patients", "Unsplash"),
-        ("https://images.unsplash.com/photo-1579684385127-1ef15d508118?w=600", "Healthcare accessibility illustration", "Unsplash"),
+        ("https://images.unsplash.com/photo-1538108149393-fbbd81895907?w=600&q=60&auto=format", "Community health clinic serving patients", "Unsplash"),
+        ("https://images.unsplash.com/photo-1579684385127-1ef15d508118?w=600&q=60&auto=format", "Healthcare accessibility illustration", "Unsplash"),
     ],
     "insurance": [
-        ("https://images.unsplash.com/photo-1450101499163-c8848c66ca85?w=600", "Health insurance documentation", "Unsplash"),
-        ("https://images.unsplash.com/photo-1554224155-8d04cb21cd6c?w=600", "Financial planning for healthcare", "Unsplash"),
+        ("https://images.unsplash.com/photo-1450101499163-c8848c66ca85?w=600&q=60&auto=format", "Health insurance documentation", "Unsplash"),
+        ("https://images.unsplash.com/photo-1554224155-8d04cb21cd6c?w=600&q=60&auto=format", "Financial planning for healthcare", "Unsplash"),
     ],
     "hospital": [
-        ("https://images.unsplash.com/photo-1519494026892-80bbd2d6fd0d?w=600", "Modern hospital facility", "Unsplash"),
-        ("https://images.unsplash.com/photo-1586773860418-d37222d8fce3?w=600", "Hospital corridor and medical equipment", "Unsplash"),
+        ("https://images.unsplash.com/photo-1519494026892-80bbd2d6fd0d?w=600&q=60&auto=format", "Modern hospital facility", "Unsplash"),
+        ("https://images.unsplash.com/photo-1586773860418-d37222d8fce3?w=600&q=60&auto=format", "Hospital corridor and medical equipment", "Unsplash"),
     ],
     "prescription": [
-        ("https://images.unsplash.com/photo-1584308666744-24d5c474f2ae?w=600", "Prescription medications and pharmacy", "Unsplash"),
-        ("https://images.unsplash.com/photo-1587854692152-cbe660dbde88?w=600", "Pharmaceutical drugs close-up", "Unsplash"),
+        ("https://images.unsplash.com/photo-1584308666744-24d5c474f2ae?w=600&q=60&auto=format", "Prescription medications and pharmacy", "Unsplash"),
+        ("https://images.unsplash.com/photo-1587854692152-cbe660dbde88?w=600&q=60&auto=format", "Pharmaceutical drugs close-up", "Unsplash"),
     ],
     "default": [
-        ("https://images.unsplash.com/photo-1505751172876-fa1923c5c528?w=600", "Healthcare professional at work", "Unsplash"),
-        ("https://images.unsplash.com/photo-1551076805-e1869033e561?w=600", "Medical stethoscope and equipment", "Unsplash"),
-        ("https://images.unsplash.com/photo-1581595220892-b0739db3ba8c?w=600", "Doctor consultation with patient", "Unsplash"),
+        ("https://images.unsplash.com/photo-1505751172876-fa1923c5c528?w=600&q=60&auto=format", "Healthcare professional at work", "Unsplash"),
+        ("https://images.unsplash.com/photo-1551076805-e1869033e561?w=600&q=60&auto=format", "Medical stethoscope and equipment", "Unsplash"),
+        ("https://images.unsplash.com/photo-1581595220892-b0739db3ba8c?w=600&q=60&auto=format", "Doctor consultation with patient", "Unsplash"),
     ]
 }
 
+# Image bucket -> (title keywords, category keywords), checked in priority order
+_IMAGE_RULES = (
+    ("medicare", ("medicare",), ("medicare",)),
+    ("medicaid", ("medicaid",), ("medicaid",)),
+    ("insurance", ("insurance",), ("plan",)),
+    ("hospital", ("hospital", "facility"), ()),
+    ("prescription", ("drug", "prescription", "pharma"), ()),
+)
+
 def get_article_images(category, title):
     """Get relevant images based on article category and title"""
     title_lower = title.lower()
     category_lower = category.lower()
     
-    # Match keywords to image categories
-    if "medicare" in title_lower or "medicare" in category_lower:
-        images = HEALTHCARE_IMAGES["medicare"]
-    elif "medicaid" in title_lower or "medicaid" in category_lower:
-        images = HEALTHCARE_IMAGES["medicaid"]
-    elif "insurance" in title_lower or "plan" in category_lower:
-        images = HEALTHCARE_IMAGES["insurance"]
-    elif "hospital" in title_lower or "facility" in title_lower:
-        images = HEALTHCARE_IMAGES["hospital"]
-    elif "drug" in title_lower or "prescription" in title_lower or "pharma" in title_lower:
-        images = HEALTHCARE_IMAGES["prescription"]
-    else:
-        images = HEALTHCARE_IMAGES["default"]
-    
-    return images
+    for bucket, title_keys, category_keys in _IMAGE_RULES:
+        if any(k in title_lower for k in title_keys) or any(k in category_lower for k in category_keys):
+            return HEALTHCARE_IMAGES[bucket]
+    return HEALTHCARE_IMAGES["default"]
 
 # Session State
-for k, v in [('api_key', os.environ.get('OPENAI_API_KEY', '')), ('model', 'gpt-4o'), 
-             ('result', None), ('mode', None), ('agent', 0), ('generating', False)]:
-    if k not in st.session_state:
-        st.session_state[k] = v
-
-def run_gen(orch, tq, cp, cb):
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+for k, v in (('api_key', os.environ.get('OPENAI_API_KEY', '')), ('model', 'gpt-4o'), 
+             ('result', None), ('mode', None), ('agent', 0), ('generating', False),
+             ('prefetched', None), ('result_html', {}), ('job', None), ('gen_ts', None),
+             ('user_id', uuid.uuid4().hex)):
+    st.session_state.setdefault(k, v)
+
+@st.cache_resource
+def get_event_loop():
+    """One long-lived event loop on a daemon thread, shared by all sessions
+    
+    Keeping it alive lets the OpenAI client reuse its HTTP connections
+    across generations instead of reconnecting on every click. Uses uvloop
+    when it is installed.
+    """
     try:
-        return loop.run_until_complete(orch.generate_article(tq, cp, cb))
-    finally:
-        loop.close()
+        import uvloop
+        loop = uvloop.new_event_loop()
+    except ImportError:
+        loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="agent-loop", daemon=True).start()
+    return loop
 
-def get_header_html(agent_num):
-    """Generate header with logo, ticker, and progress"""
-    # Build ticker content (duplicate for seamless loop)
-    ticker_items = "".join([f'<span class="ticker-item">{t}</span>' for t in TRENDING_TOPICS])
-    ticker_html = ticker_items + ticker_items  # Duplicate for seamless animation
+@st.cache_resource
+def get_orchestrator(api_key, model, merged=False):
+    """Orchestrator (and its API client) built once per key/model/mode"""
+    # Deferred so the openai client isn't imported before the first paint
+    from agents import HealthcareAgentOrchestrator
+    return HealthcareAgentOrchestrator(api_key=api_key, model=model, merged_prompt_mode=merged)
+
+@st.cache_resource
+def start_warmup(api_key, model):
+    """Once per process, pre-generate the most requested topics in the background
+    
+    Off unless LLM_WARM_TOPICS is set; needs the result cache, ideally with
+    LLM_CACHE_DIR so request counts survive restarts.
+    """
+    limit = int(os.getenv("LLM_WARM_TOPICS", "0"))
+    if limit <= 0:
+        return None
+    return asyncio.run_coroutine_threadsafe(
+        get_orchestrator(api_key, model, False).warm_results(limit),
+        get_event_loop()
+    )
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def export_article(fmt, title, content, meta, score, keywords, generated):
+    """Export bytes for one article, reused across reruns
     
+    generated is the generation time the export is stamped with, so every
+    format and the download filenames carry the same date.
+    """
+    from utils import ArticleExporter
+    exp = ArticleExporter(title, content, meta, score, list(keywords), generated)
+    return exp.export_to_txt() if fmt == "txt" else exp.export_to_docx()
+
+def request_generation():
+    """Generate button callback, read by the next run"""
+    st.session_state.generate_requested = True
+
+def start_gen(orch, tq, cp, user_id=None):
+    """Submit a generation to the agent loop and return its job handle
+    
+    The job lives in session state, so a rerun triggered mid-generation
+    (any widget click) picks up polling where the last run stopped instead
+    of losing the result. user_id puts it in that session's queue on the
+    orchestrator, which is shared by every session. The streamed draft is
+    kept on the job too, with how much of it is on screen, so every run can
+    redraw it without waiting for the next chunk.
+    """
+    events = queue.Queue()
+    draft = []
+    future = asyncio.run_coroutine_threadsafe(
+        orch.generate_article(
+            tq, cp, lambda msg, pct: events.put((msg, pct)),
+            user_id=user_id, stream_callback=draft.append
+        ),
+        get_event_loop()
+    )
+    return {"future": future, "events": events, "draft": draft, "shown": 0}
+
+# How long one script run polls a generation before rerunning
+POLL_SLICE_SECONDS = 1.0
+
+def poll_gen(job, cb, draft_cb=None, budget=POLL_SLICE_SECONDS):
+    """Replay a job's progress for up to budget seconds
+    
+    Returns the result once the job is done, or None if it is still running
+    when the budget runs out; the caller then reruns the script, which is
+    when clicks made meanwhile (Cancel) take effect.
+    """
+    # Progress callbacks touch Streamlit elements, so they must run on this
+    # script thread: the loop thread queues them and we replay them here.
+    # Streamed draft chunks are collected the same way and re-rendered at
+    # most once per poll, so a fast stream doesn't flood the websocket.
+    future, events, draft = job["future"], job["events"], job["draft"]
+    deadline = time.monotonic() + budget
+    while not future.done() or not events.empty():
+        if not future.done() and time.monotonic() >= deadline:
+            return None
+        try:
+            latest = events.get(timeout=0.1)
+        except queue.Empty:
+            latest = None
+        # Only the newest of any backlog of updates is worth drawing
+        while not events.empty():
+            latest = events.get_nowait()
+        if latest:
+            cb(*latest)
+        if draft_cb and len(draft) > job["shown"]:
+            job["shown"] = len(draft)
+            draft_cb("".join(draft[:job["shown"]]))
+    return future.result()
+
+def _build_header_html(agent_num):
+    """Generate header with logo, ticker, and progress"""
     # Build progress steps
     steps = ["Trend Discovery", "Content Writer", "SEO Examiner", "Consolidator"]
-    steps_html = ""
+    parts = []
     
     for i, name in enumerate(steps):
         n = i + 1
@@ -570,10 +684,11 @@ def get_header_html(agent_num):
             dot_cls, txt_cls, line_cls = "wait", "", ""
             icon = str(n)
         
-        steps_html += f'<div class="step"><div class="step-dot {dot_cls}">{icon}</div><span class="step-text {txt_cls}">{name}</span>'
+        parts.append(f'<div class="step"><div class="step-dot {dot_cls}">{icon}</div><span class="step-text {txt_cls}">{name}</span>')
         if i < 3:
-            steps_html += f'<div class="step-line {line_cls}"></div>'
-        steps_html += '</div>'
+            parts.append(f'<div class="step-line {line_cls}"></div>')
+        parts.append('</div>')
+    steps_html = "".join(parts)
     
     return f"""
         <div class="main-header">
@@ -588,7 +703,7 @@ def get_header_html(agent_num):
                 <div class="ticker-section">
                     <div class="ticker-label">🔥 TRENDING</div>
                     <div class="ticker-wrapper">
-                        <div class="ticker-content">{ticker_html}</div>
+                        <div class="ticker-content">{_TICKER_HTML}</div>
                     </div>
                 </div>
             </div>
@@ -596,6 +711,79 @@ def get_header_html(agent_num):
         </div>
     """
 
+# agent_num is always 0-5, so every header variant is built once at import
+_HEADER_HTML = tuple(_build_header_html(n) for n in range(6))
+
+def get_header_html(agent_num):
+    """Header HTML for a pipeline stage (0 = idle, 5 = done)"""
+    return _HEADER_HTML[agent_num]
+
+# Article card, filled per result by get_article_html
+_ARTICLE_CARD_TEMPLATE = """
+        <div class="art-box">
+            <div class="art-head">
+                <div class="art-cat">{category}</div>
+                <div class="art-title">{title}</div>
+                <div class="art-meta">{date} • {word_count} words • SEO: {score:.0f}% • {mode}</div>
+            </div>
+            <div class="art-desc">{description}</div>
+            <div class="art-body">{body}</div>
+            <div class="art-foot"><b>Internal:</b> {internal} | <b>External:</b> {external}</div>
+        </div>
+    """
+
+def get_article_html(r, mode, generated):
+    """Full article card HTML for one result
+    
+    Model-written plain-text fields are escaped; the body is markdown/HTML
+    and goes in as is. generated is the stored generation time, so the card
+    shows the same date as the exports.
+    """
+    a = r.article
+    # Get relevant images, then insert the first into the content
+    images = get_article_images(r.category_path, a.title)
+    
+    return _ARTICLE_CARD_TEMPLATE.format_map({
+        "category": html.escape(r.category_path),
+        "title": html.escape(a.title),
+        "date": generated.strftime("%b %d, %Y"),
+        "word_count": a.word_count,
+        "score": r.seo_validation.overall_score,
+        "mode": mode,
+        "description": html.escape(a.meta_description),
+        "body": insert_images_in_content(a.content, images),
+        "internal": html.escape(", ".join(a.internal_links[:3])) if a.internal_links else "-",
+        "external": html.escape(", ".join(a.external_links[:3])) if a.external_links else "-"
+    })
+
+def get_checklist_html(r):
+    """First eight SEO checklist rows for one result, escaped like the other model text"""
+    return "".join(
+        f'<div class="chk">{"✅" if ok else "❌"} {html.escape(item[:24] + "..." if len(item) > 24 else item)}</div>'
+        for item, ok in list(r.seo_validation.validation_checklist.items())[:8]
+    )
+
+_EMPTY_CHECKLIST_HTML = "".join(
+    f'<div class="chk" style="color:#ccc">○ {item[:24]}...</div>'
+    for item in ["Primary keyword in title", "Keyword in first para", "Single H1 present",
+                 "5+ H2 headings", "Meta description opt", "Word count >= 1500", "Keyword density 1-3%", "Heading hierarchy"]
+)
+
+def get_keywords_html(r):
+    """First six keyword chips for one result; keywords are model-written, so escaped"""
+    kws = islice(chain(r.article.primary_keywords, r.article.secondary_keywords), 6)
+    return "".join(f'<span class="kw">{html.escape(k)}</span>' for k in kws)
+
+def result_html(part, build):
+    """HTML for one part of the current result, built once per result
+    
+    Reruns from unrelated widgets reuse it; starting a generation clears it.
+    """
+    cache = st.session_state.result_html
+    if part not in cache:
+        cache[part] = build(st.session_state.result)
+    return cache[part]
+
 def insert_images_in_content(content, images):
     """Insert images after first H2 heading in content"""
     if not images:
@@ -615,18 +803,125 @@ def insert_images_in_content(content, images):
     """
     
     # Insert after first </h2> or after first paragraph
-    if "</h2>" in content:
-        parts = content.split("</h2>", 1)
-        return parts[0] + "</h2>" + image_html + parts[1]
-    elif "</p>" in content:
-        parts = content.split("</p>", 1)
-        return parts[0] + "</p>" + image_html + parts[1]
+    for tag in ("</h2>", "</p>"):
+        head, sep, tail = content.partition(tag)
+        if sep:
+            return f"{head}{sep}{image_html}{tail}"
     
     return image_html + content
 
+def render_downloads():
+    """Download buttons for the current result, if there is one"""
+    if not st.session_state.result:
+        return
+    from utils import get_download_filename
+    st.markdown('<div class="panel-title" style="margin-top:20px">⬇️ DOWNLOAD</div>', unsafe_allow_html=True)
+    r = st.session_state.result
+    gen_ts = st.session_state.gen_ts or datetime.now()
+    export_args = (r.article.title, r.article.content, r.article.meta_description,
+                   r.seo_validation.overall_score, r.article.primary_keywords, gen_ts)
+    
+    c1, c2 = st.columns(2)
+    with c1:
+        st.download_button("📄 TXT", export_article("txt", *export_args), 
+                           get_download_filename(r.article.title, "txt", gen_ts), 
+                           "text/plain", use_container_width=True)
+    with c2:
+        docx = export_article("docx", *export_args)
+        if docx:
+            st.download_button("📘 DOCX", docx, 
+                               get_download_filename(r.article.title, "docx", gen_ts),
+                               "application/vnd.openxmlformats-officedocument.wordprocessingml.document", 
+                               use_container_width=True)
+
+def render_article(placeholder):
+    """Article card, generating card or empty state, into placeholder"""
+    if st.session_state.result:
+        placeholder.markdown(
+            result_html("article", lambda r: get_article_html(
+                r, st.session_state.mode, st.session_state.gen_ts or datetime.now()
+            )),
+            unsafe_allow_html=True
+        )
+    elif st.session_state.generating:
+        job = st.session_state.job
+        if job and job["draft"]:
+            # Redraw the streamed draft straight away so a rerun mid-stream
+            # doesn't flash back to the "Generating" card
+            shown = len(job["draft"])
+            placeholder.markdown("".join(job["draft"][:shown]))
+            job["shown"] = shown
+            return
+        agent_names = ["", "Trend Discovery", "Content Writer", "SEO Examiner", "Consolidator"]
+        current_name = agent_names[st.session_state.agent] if st.session_state.agent > 0 else "Starting"
+        placeholder.markdown(f"""
+            <div class="art-box">
+                <div class="generating-state">
+                    <div class="generating-icon">⚙️</div>
+                    <div class="generating-text">Generating Article...</div>
+                    <div class="generating-sub">Currently running: {current_name}</div>
+                </div>
+            </div>
+        """, unsafe_allow_html=True)
+    else:
+        placeholder.markdown("""
+            <div class="art-box">
+                <div class="empty-state">
+                    <div class="empty-icon">📝</div>
+                    <div class="empty-text">Select a topic and click<br><b>Generate Article</b></div>
+                </div>
+            </div>
+        """, unsafe_allow_html=True)
+
+def render_stats():
+    """Stats and image suggestion panels"""
+    st.markdown('<div class="panel-title">📊 STATS</div>', unsafe_allow_html=True)
+    
+    if st.session_state.result:
+        r = st.session_state.result
+        score = r.seo_validation.overall_score
+        cls = "good" if score >= 80 else "med" if score >= 60 else "bad"
+        stats = [("Words", r.article.word_count), ("Headings", len(r.article.headings)), ("Keywords", len(r.article.primary_keywords))]
+        seo_html = f'<div class="seo-box {cls}"><span class="seo-num">{score:.0f}%</span><span class="seo-txt">SEO SCORE</span></div>'
+    else:
+        stats = [("Words", "-"), ("Headings", "-"), ("Keywords", "-")]
+        seo_html = '<div class="seo-box" style="background:#f0f0f0"><span class="seo-num" style="color:#ccc">-</span><span class="seo-txt">SEO SCORE</span></div>'
+    # One element for the whole panel instead of one per stat
+    st.markdown("".join(
+        f'<div class="stat-item"><span class="stat-lbl">{lbl}</span><span class="stat-val">{val}</span></div>'
+        for lbl, val in stats
+    ) + seo_html, unsafe_allow_html=True)
+    
+    st.markdown('<div class="panel-title" style="margin-top:16px">📷 IMAGES</div>', unsafe_allow_html=True)
+    if st.session_state.result and st.session_state.result.article.image_suggestions:
+        st.markdown("".join(
+            f'<div class="img-box">{i}. {img.description[:40]}...</div>'
+            for i, img in enumerate(st.session_state.result.article.image_suggestions[:3], 1)
+        ), unsafe_allow_html=True)
+    else:
+        st.caption("Generate to see suggestions")
+
+def render_seo_panels():
+    """SEO checklist and keyword panels"""
+    st.markdown('<div class="panel-title">✓ SEO CHECKLIST</div>', unsafe_allow_html=True)
+    
+    if st.session_state.result:
+        # A report without a checklist shows the empty rows, not a blank panel
+        st.markdown(result_html("checklist", get_checklist_html) or _EMPTY_CHECKLIST_HTML, unsafe_allow_html=True)
+    else:
+        st.markdown(_EMPTY_CHECKLIST_HTML, unsafe_allow_html=True)
+    
+    st.markdown('<div class="panel-title" style="margin-top:16px">🔑 KEYWORDS</div>', unsafe_allow_html=True)
+    if st.session_state.result:
+        st.markdown(result_html("keywords", get_keywords_html), unsafe_allow_html=True)
+    else:
+        st.caption("Keywords appear after generation")
+
 def main():
     api_key = st.session_state.api_key
     is_valid = api_key and api_key.startswith('sk-') and len(api_key) > 20
+    if is_valid:
+        start_warmup(api_key, st.session_state.model)
     
     # Determine agent state
     if st.session_state.result:
@@ -648,14 +943,14 @@ def main():
         st.markdown('<div class="panel-title">📋 TOPIC SELECTION</div>', unsafe_allow_html=True)
         
         st.markdown('<div class="topic-lbl">Category</div>', unsafe_allow_html=True)
-        main_cat = st.selectbox("c1", get_main_categories(), label_visibility="collapsed")
+        main_cat = st.selectbox("c1", cached_main_categories(), label_visibility="collapsed")
         
         st.markdown('<div class="topic-lbl">Subcategory</div>', unsafe_allow_html=True)
-        sub_cats = get_subcategories(main_cat)
+        sub_cats = cached_subcategories(main_cat)
         sub_cat = st.selectbox("c2", sub_cats if sub_cats else ["ALL"], label_visibility="collapsed")
         
         st.markdown('<div class="topic-lbl">Specific Topic</div>', unsafe_allow_html=True)
-        spec_topics = get_specific_topics(main_cat, sub_cat)
+        spec_topics = cached_specific_topics(main_cat, sub_cat)
         
         if spec_topics and sub_cat != "ALL":
             filtered_topics = [t for t in spec_topics if t.upper() != "ALL"]
@@ -664,140 +959,85 @@ def main():
             spec = None
             st.selectbox("c3d", ["ALL"], label_visibility="collapsed", disabled=True)
         
-        topic_query = build_topic_query(main_cat, sub_cat, spec)
+        topic_query = cached_topic_query(main_cat, sub_cat, spec)
         
         # Mode
         mode_cls = "live" if is_valid else "demo"
         mode_txt = "● LIVE MODE" if is_valid else "● DEMO MODE"
         st.markdown(f'<div class="mode-tag {mode_cls}">{mode_txt}</div>', unsafe_allow_html=True)
+        fast_mode = st.toggle("⚡ Fast mode (merged)", disabled=not is_valid,
+                              help="Run all agents in one merged API call")
         
-        generate = st.button("🚀 Generate Article", use_container_width=True, disabled=st.session_state.generating)
+        # Start Trend Discovery for the chosen topic while the user is still
+        # deciding; the orchestrator ignores this unless LLM_PREFETCH_TRENDS is set
+        if is_valid and not fast_mode and topic_query != st.session_state.prefetched:
+            st.session_state.prefetched = topic_query
+            asyncio.run_coroutine_threadsafe(
+                get_orchestrator(st.session_state.api_key, st.session_state.model, False).prefetch_trend(topic_query),
+                get_event_loop()
+            )
+        
+        # Generate is redrawn in its slot as the job starts and ends, so its
+        # click is read through the callback, which fires for any copy
+        generate_slot = st.empty()
+        generate_slot.button("🚀 Generate Article", key="generate", on_click=request_generation,
+                             use_container_width=True, disabled=st.session_state.generating)
+        generate = st.session_state.pop("generate_requested", False)
+        cancel_slot = st.empty()
+        if st.session_state.job:
+            if cancel_slot.button("✖ Cancel", key="cancel", use_container_width=True):
+                st.session_state.job["future"].cancel()
+                st.session_state.job = None
+                st.session_state.generating = False
+                st.session_state.agent = 0
+                st.rerun()
         
         # Downloads
-        if st.session_state.result:
-            st.markdown('<div class="panel-title" style="margin-top:20px">⬇️ DOWNLOAD</div>', unsafe_allow_html=True)
-            r = st.session_state.result
-            exp = ArticleExporter(r.article.title, r.article.content, r.article.meta_description,
-                                  r.seo_validation.overall_score, r.article.primary_keywords)
-            
-            c1, c2 = st.columns(2)
-            with c1:
-                st.download_button("📄 TXT", exp.export_to_txt(), 
-                                   get_download_filename(r.article.title, "txt"), 
-                                   "text/plain", use_container_width=True)
-            with c2:
-                docx = exp.export_to_docx()
-                if docx:
-                    st.download_button("📘 DOCX", docx, 
-                                       get_download_filename(r.article.title, "docx"),
-                                       "application/vnd.openxmlformats-officedocument.wordprocessingml.document", 
-                                       use_container_width=True)
+        downloads_slot = st.empty()
+        with downloads_slot.container():
+            render_downloads()
     
     # COL 2: Article
     with col2:
         article_placeholder = st.empty()
-        
-        if st.session_state.result:
-            r = st.session_state.result
-            int_l = ", ".join(r.article.internal_links[:3]) if r.article.internal_links else "-"
-            ext_l = ", ".join(r.article.external_links[:3]) if r.article.external_links else "-"
-            
-            # Get relevant images
-            images = get_article_images(r.category_path, r.article.title)
-            
-            # Insert image into content
-            content_with_images = insert_images_in_content(r.article.content, images)
-            
-            article_placeholder.markdown(f"""
-                <div class="art-box">
-                    <div class="art-head">
-                        <div class="art-cat">{r.category_path}</div>
-                        <div class="art-title">{r.article.title}</div>
-                        <div class="art-meta">{datetime.now().strftime("%b %d, %Y")} • {r.article.word_count} words • SEO: {r.seo_validation.overall_score:.0f}% • {st.session_state.mode}</div>
-                    </div>
-                    <div class="art-desc">{r.article.meta_description}</div>
-                    <div class="art-body">{content_with_images}</div>
-                    <div class="art-foot"><b>Internal:</b> {int_l} | <b>External:</b> {ext_l}</div>
-                </div>
-            """, unsafe_allow_html=True)
-        elif st.session_state.generating:
-            agent_names = ["", "Trend Discovery", "Content Writer", "SEO Examiner", "Consolidator"]
-            current_name = agent_names[st.session_state.agent] if st.session_state.agent > 0 else "Starting"
-            article_placeholder.markdown(f"""
-                <div class="art-box">
-                    <div class="generating-state">
-                        <div class="generating-icon">⚙️</div>
-                        <div class="generating-text">Generating Article...</div>
-                        <div class="generating-sub">Currently running: {current_name}</div>
-                    </div>
-                </div>
-            """, unsafe_allow_html=True)
-        else:
-            article_placeholder.markdown("""
-                <div class="art-box">
-                    <div class="empty-state">
-                        <div class="empty-icon">📝</div>
-                        <div class="empty-text">Select a topic and click<br><b>Generate Article</b></div>
-                    </div>
-                </div>
-            """, unsafe_allow_html=True)
+        render_article(article_placeholder)
     
     # COL 3: Stats
     with col3:
-        st.markdown('<div class="panel-title">📊 STATS</div>', unsafe_allow_html=True)
-        
-        if st.session_state.result:
-            r = st.session_state.result
-            for lbl, val in [("Words", r.article.word_count), ("Headings", len(r.article.headings)), ("Keywords", len(r.article.primary_keywords))]:
-                st.markdown(f'<div class="stat-item"><span class="stat-lbl">{lbl}</span><span class="stat-val">{val}</span></div>', unsafe_allow_html=True)
-            
-            score = r.seo_validation.overall_score
-            cls = "good" if score >= 80 else "med" if score >= 60 else "bad"
-            st.markdown(f'<div class="seo-box {cls}"><span class="seo-num">{score:.0f}%</span><span class="seo-txt">SEO SCORE</span></div>', unsafe_allow_html=True)
-        else:
-            for lbl in ["Words", "Headings", "Keywords"]:
-                st.markdown(f'<div class="stat-item"><span class="stat-lbl">{lbl}</span><span class="stat-val">-</span></div>', unsafe_allow_html=True)
-            st.markdown('<div class="seo-box" style="background:#f0f0f0"><span class="seo-num" style="color:#ccc">-</span><span class="seo-txt">SEO SCORE</span></div>', unsafe_allow_html=True)
-        
-        st.markdown('<div class="panel-title" style="margin-top:16px">📷 IMAGES</div>', unsafe_allow_html=True)
-        if st.session_state.result and st.session_state.result.article.image_suggestions:
-            for i, img in enumerate(st.session_state.result.article.image_suggestions[:3], 1):
-                desc = img.get('description', str(img))[:40] if isinstance(img, dict) else str(img)[:40]
-                st.markdown(f'<div class="img-box">{i}. {desc}...</div>', unsafe_allow_html=True)
-        else:
-            st.caption("Generate to see suggestions")
+        stats_slot = st.empty()
+        with stats_slot.container():
+            render_stats()
     
     # COL 4: SEO Checklist & Keywords
     with col4:
-        st.markdown('<div class="panel-title">✓ SEO CHECKLIST</div>', unsafe_allow_html=True)
-        
-        if st.session_state.result:
-            for item, ok in list(st.session_state.result.seo_validation.validation_checklist.items())[:8]:
-                short = item[:24] + "..." if len(item) > 24 else item
-                st.markdown(f'<div class="chk">{"✅" if ok else "❌"} {short}</div>', unsafe_allow_html=True)
-        else:
-            for item in ["Primary keyword in title", "Keyword in first para", "Single H1 present",
-                        "5+ H2 headings", "Meta description opt", "Word count >= 1500", "Keyword density 1-3%", "Heading hierarchy"]:
-                st.markdown(f'<div class="chk" style="color:#ccc">○ {item[:24]}...</div>', unsafe_allow_html=True)
-        
-        st.markdown('<div class="panel-title" style="margin-top:16px">🔑 KEYWORDS</div>', unsafe_allow_html=True)
-        if st.session_state.result:
-            kws = st.session_state.result.article.primary_keywords + st.session_state.result.article.secondary_keywords
-            st.markdown("".join([f'<span class="kw">{k}</span>' for k in kws[:6]]), unsafe_allow_html=True)
-        else:
-            st.caption("Keywords appear after generation")
+        seo_slot = st.empty()
+        with seo_slot.container():
+            render_seo_panels()
     
     # ========== Generation Logic ==========
     if generate:
+        # A click can't reach a job started by an earlier one, so stop it
+        # rather than leave it running unseen
+        if st.session_state.job:
+            st.session_state.job["future"].cancel()
+        generate_slot.button("🚀 Generate Article", key="generate_busy", use_container_width=True, disabled=True)
         st.session_state.mode = "LIVE" if is_valid else "DEMO"
         st.session_state.result = None
+        st.session_state.result_html = {}
         st.session_state.generating = True
         st.session_state.agent = 1
         
         header_placeholder.markdown(get_header_html(1), unsafe_allow_html=True)
         
-        agent_names = ["", "Trend Discovery", "Content Writer", "SEO Examiner", "Consolidator"]
-        
+        orch = get_orchestrator(
+            st.session_state.api_key if is_valid else None,
+            st.session_state.model,
+            fast_mode and is_valid
+        )
+        st.session_state.job = start_gen(orch, topic_query, topic_query, st.session_state.user_id)
+        cancel_slot.button("✖ Cancel", key="cancel", use_container_width=True)
+    
+    if st.session_state.job:
         def update_progress(msg, pct):
             if pct <= 25:
                 new_agent = 1
@@ -811,38 +1051,51 @@ def main():
             if new_agent != st.session_state.agent:
                 st.session_state.agent = new_agent
                 header_placeholder.markdown(get_header_html(new_agent), unsafe_allow_html=True)
-                article_placeholder.markdown(f"""
-                    <div class="art-box">
-                        <div class="generating-state">
-                            <div class="generating-icon">⚙️</div>
-                            <div class="generating-text">Generating Article...</div>
-                            <div class="generating-sub">Currently running: {agent_names[new_agent]}</div>
-                        </div>
-                    </div>
-                """, unsafe_allow_html=True)
+                # Once a draft is streaming it stays on screen
+                if not st.session_state.job["draft"]:
+                    render_article(article_placeholder)
         
+        job = st.session_state.job
         try:
-            orch = HealthcareAgentOrchestrator(
-                api_key=st.session_state.api_key if is_valid else None,
-                model=st.session_state.model
-            )
-            
-            result = run_gen(orch, topic_query, topic_query, update_progress)
+            # A rerun raised from a callback here leaves the job in place
+            # for the next run to resume
+            result = poll_gen(job, update_progress, article_placeholder.markdown)
+            if not job["future"].done():
+                # Rerun so clicks made while polling (Cancel) are handled;
+                # the next run picks the job up again
+                st.rerun()
+            st.session_state.job = None
             
             if result and hasattr(result, 'article'):
-                st.session_state.result = result
-                st.session_state.agent = 5
-                st.session_state.generating = False
+                st.session_state.update(result=result, gen_ts=datetime.now(), agent=5, generating=False)
+                # Fill the result panels in this run rather than rerunning
+                # the whole script
+                cancel_slot.empty()
                 header_placeholder.markdown(get_header_html(5), unsafe_allow_html=True)
-                st.rerun()
+                with downloads_slot.container():
+                    render_downloads()
+                render_article(article_placeholder)
+                with stats_slot.container():
+                    render_stats()
+                with seo_slot.container():
+                    render_seo_panels()
             else:
+                cancel_slot.empty()
                 st.error("Generation failed - please try again")
                 st.session_state.generating = False
                 st.session_state.agent = 0
         except Exception as e:
-            st.error(f"Error: {e}")
+            st.session_state.job = None
+            cancel_slot.empty()
+            # Full trace goes to the server log; the UI only gets the summary
+            traceback.print_exc(limit=5)
+            st.error(f"Error: {type(e).__name__}: {e}")
             st.session_state.generating = False
             st.session_state.agent = 0
+        
+        # The job is over; this run drew Generate disabled, so enable it
+        generate_slot.button("🚀 Generate Article", key="generate_ready", on_click=request_generation,
+                             use_container_width=True)
 
 if __name__ == "__main__":
     main()
@@ -3,7 +3,8 @@ Healthcare Topics Configuration
 Defines the hierarchical dropdown structure for topic selection
 """
 
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 @dataclass
@@ -20,7 +21,7 @@ class TopicCategory:
         return all_topics
 
 # Trusted US Healthcare Sources
-TRUSTED_SOURCES = [
+TRUSTED_SOURCES = (
     "CMS (Centers for Medicare & Medicaid Services)",
     "CDC (Centers for Disease Control and Prevention)",
     "HHS (Department of Health and Human Services)",
@@ -31,98 +32,105 @@ TRUSTED_SOURCES = [
     "AHA (American Hospital Association)",
     "AHRQ (Agency for Healthcare Research and Quality)",
     "FDA (Food and Drug Administration)"
-]
+)
 
 # Healthcare Topic Hierarchy
 TOPIC_HIERARCHY = {
     "GOVERNMENT PLANS": {
-        "ALL": ["Medicare", "Medicaid", "ACA"],
+        "ALL": ("Medicare", "Medicaid", "ACA"),
         "Medicare": {
-            "ALL": ["Part A", "Part B", "Part C (Medicare Advantage)", "Part D", "Medigap", "Tricare", "VA Healthcare"],
-            "Part A": ["Hospital Insurance", "Inpatient Care", "Skilled Nursing", "Hospice"],
-            "Part B": ["Medical Insurance", "Outpatient Care", "Preventive Services", "Durable Medical Equipment"],
-            "Part C (Medicare Advantage)": ["HMO Plans", "PPO Plans", "Special Needs Plans", "Private Fee-for-Service"],
-            "Part D": ["Prescription Drug Coverage", "Formulary", "Coverage Gap", "Extra Help Program"],
-            "Medigap": ["Supplement Insurance", "Policy Types", "Enrollment Periods"],
-            "Tricare": ["Military Healthcare", "Tricare Prime", "Tricare Select", "Tricare for Life"],
-            "VA Healthcare": ["Veterans Benefits", "Priority Groups", "VA Medical Centers"]
+            "ALL": ("Part A", "Part B", "Part C (Medicare Advantage)", "Part D", "Medigap", "Tricare", "VA Healthcare"),
+            "Part A": ("Hospital Insurance", "Inpatient Care", "Skilled Nursing", "Hospice"),
+            "Part B": ("Medical Insurance", "Outpatient Care", "Preventive Services", "Durable Medical Equipment"),
+            "Part C (Medicare Advantage)": ("HMO Plans", "PPO Plans", "Special Needs Plans", "Private Fee-for-Service"),
+            "Part D": ("Prescription Drug Coverage", "Formulary", "Coverage Gap", "Extra Help Program"),
+            "Medigap": ("Supplement Insurance", "Policy Types", "Enrollment Periods"),
+            "Tricare": ("Military Healthcare", "Tricare Prime", "Tricare Select", "Tricare for Life"),
+            "VA Healthcare": ("Veterans Benefits", "Priority Groups", "VA Medical Centers")
         },
         "Medicaid": {
-            "ALL": ["Medicaid Expansion", "CHIP"],
-            "Medicaid Expansion": ["State Programs", "Eligibility", "Covered Services"],
-            "CHIP": ["Children's Health Insurance", "State CHIP Programs", "Eligibility Requirements"]
+            "ALL": ("Medicaid Expansion", "CHIP"),
+            "Medicaid Expansion": ("State Programs", "Eligibility", "Covered Services"),
+            "CHIP": ("Children's Health Insurance", "State CHIP Programs", "Eligibility Requirements")
         },
-        "ACA": ["Marketplace Plans", "Essential Health Benefits", "Subsidies", "Open Enrollment"]
+        "ACA": ("Marketplace Plans", "Essential Health Benefits", "Subsidies", "Open Enrollment")
     },
     "COMMERCIAL PLANS": {
-        "ALL": ["HMO", "PPO", "EPO", "POS", "HDHP", "Catastrophic Plans"],
-        "HMO": ["Health Maintenance Organization", "Network Requirements", "Primary Care Physician", "Referral System"],
-        "PPO": ["Preferred Provider Organization", "In-Network vs Out-of-Network", "Flexibility Options"],
-        "EPO": ["Exclusive Provider Organization", "Network-Only Coverage", "Cost Structure"],
-        "POS": ["Point of Service", "Hybrid Plans", "Referral Options"],
-        "HDHP": ["High Deductible Health Plans", "HSA Compatibility", "Cost Savings", "Preventive Care"],
-        "Catastrophic Plans": ["Young Adult Coverage", "Hardship Exemptions", "Essential Benefits"]
+        "ALL": ("HMO", "PPO", "EPO", "POS", "HDHP", "Catastrophic Plans"),
+        "HMO": ("Health Maintenance Organization", "Network Requirements", "Primary Care Physician", "Referral System"),
+        "PPO": ("Preferred Provider Organization", "In-Network vs Out-of-Network", "Flexibility Options"),
+        "EPO": ("Exclusive Provider Organization", "Network-Only Coverage", "Cost Structure"),
+        "POS": ("Point of Service", "Hybrid Plans", "Referral Options"),
+        "HDHP": ("High Deductible Health Plans", "HSA Compatibility", "Cost Savings", "Preventive Care"),
+        "Catastrophic Plans": ("Young Adult Coverage", "Hardship Exemptions", "Essential Benefits")
     },
     "SUPPLEMENTAL PLANS": {
-        "ALL": ["Dental", "Vision", "Prescription Drugs Only"],
-        "Dental": ["Dental Insurance", "Preventive Care", "Major Services", "Orthodontics"],
-        "Vision": ["Vision Insurance", "Eye Exams", "Glasses and Contacts", "LASIK Coverage"],
-        "Prescription Drugs Only": ["Standalone Drug Plans", "Formulary Tiers", "Prior Authorization"]
+        "ALL": ("Dental", "Vision", "Prescription Drugs Only"),
+        "Dental": ("Dental Insurance", "Preventive Care", "Major Services", "Orthodontics"),
+        "Vision": ("Vision Insurance", "Eye Exams", "Glasses and Contacts", "LASIK Coverage"),
+        "Prescription Drugs Only": ("Standalone Drug Plans", "Formulary Tiers", "Prior Authorization")
     },
     "EXCHANGE": {
-        "ALL": ["On-Exchange", "Off-Exchange"],
-        "On-Exchange": ["Marketplace Plans", "Premium Tax Credits", "Cost-Sharing Reductions", "Special Enrollment"],
-        "Off-Exchange": ["Private Plans", "Direct Enrollment", "Broker-Sold Plans"]
+        "ALL": ("On-Exchange", "Off-Exchange"),
+        "On-Exchange": ("Marketplace Plans", "Premium Tax Credits", "Cost-Sharing Reductions", "Special Enrollment"),
+        "Off-Exchange": ("Private Plans", "Direct Enrollment", "Broker-Sold Plans")
     },
     "CODES": {
-        "ALL": ["ICD-10-CM", "CPT", "HCPCS", "ICD-10-PCS", "NDC", "DRG", "Revenue Codes", "CDT", "Modifiers"],
-        "Diagnosis – ICD-10-CM": ["Diagnosis Coding", "ICD-10-CM Updates", "Clinical Documentation", "Coding Guidelines"],
-        "Procedures – CPT": ["Procedure Codes", "Evaluation and Management", "Surgical Codes", "CPT Updates"],
-        "Supplies – HCPCS": ["Medical Supplies", "Durable Medical Equipment", "Level II Codes", "Billing Guidelines"],
-        "InPatient – ICD-10-PCS": ["Inpatient Procedure Coding", "Body Systems", "Root Operations", "Device Coding"],
-        "Drugs – NDC": ["National Drug Code", "Drug Identification", "FDA Database", "Reimbursement"],
-        "Payment – DRG": ["Diagnosis Related Groups", "Hospital Reimbursement", "Case Mix Index", "Severity Levels"],
-        "Facility – Revenue Codes": ["Revenue Cycle", "UB-04 Billing", "Charge Capture", "Payer Requirements"],
-        "Dental – CDT": ["Dental Procedure Codes", "ADA Codes", "Dental Documentation"],
-        "Rules – Modifiers": ["CPT Modifiers", "HCPCS Modifiers", "Correct Modifier Usage", "Modifier Guidelines"]
+        "ALL": ("ICD-10-CM", "CPT", "HCPCS", "ICD-10-PCS", "NDC", "DRG", "Revenue Codes", "CDT", "Modifiers"),
+        "Diagnosis – ICD-10-CM": ("Diagnosis Coding", "ICD-10-CM Updates", "Clinical Documentation", "Coding Guidelines"),
+        "Procedures – CPT": ("Procedure Codes", "Evaluation and Management", "Surgical Codes", "CPT Updates"),
+        "Supplies – HCPCS": ("Medical Supplies", "Durable Medical Equipment", "Level II Codes", "Billing Guidelines"),
+        "InPatient – ICD-10-PCS": ("Inpatient Procedure Coding", "Body Systems", "Root Operations", "Device Coding"),
+        "Drugs – NDC": ("National Drug Code", "Drug Identification", "FDA Database", "Reimbursement"),
+        "Payment – DRG": ("Diagnosis Related Groups", "Hospital Reimbursement", "Case Mix Index", "Severity Levels"),
+        "Facility – Revenue Codes": ("Revenue Cycle", "UB-04 Billing", "Charge Capture", "Payer Requirements"),
+        "Dental – CDT": ("Dental Procedure Codes", "ADA Codes", "Dental Documentation"),
+        "Rules – Modifiers": ("CPT Modifiers", "HCPCS Modifiers", "Correct Modifier Usage", "Modifier Guidelines")
     },
     "ALL": {
-        "ALL": ["Government Plans", "Commercial Plans", "Supplemental Plans", "Exchange", "Codes"]
+        "ALL": ("Government Plans", "Commercial Plans", "Supplemental Plans", "Exchange", "Codes")
     }
 }
 
-def get_main_categories() -> List[str]:
+def _build_indexes():
+    """Flatten TOPIC_HIERARCHY into per-level lookup tables in one walk
+    
+    Leaf lists are tuple literals, so tuple() hands them back without a copy.
+    """
+    subcats: Dict[str, Tuple[str, ...]] = {}
+    specifics: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+    details: Dict[Tuple[str, str, str], Tuple[str, ...]] = {}
+    for main, category_data in TOPIC_HIERARCHY.items():
+        subcats[main] = tuple(category_data)
+        for sub, sub_data in category_data.items():
+            specifics[main, sub] = tuple(sub_data)
+            if isinstance(sub_data, dict):
+                for specific, detailed in sub_data.items():
+                    details[main, sub, specific] = tuple(detailed)
+    return subcats, specifics, details
+
+# The hierarchy is static, so lookups read these tables. Results are tuples
+# so a shared value can't be mutated by a caller.
+_SUBCATEGORIES, _SPECIFIC_TOPICS, _DETAILED_TOPICS = _build_indexes()
+_MAIN_CATEGORIES = tuple(TOPIC_HIERARCHY)
+
+def get_main_categories() -> Tuple[str, ...]:
     """Get list of main category names"""
-    return list(TOPIC_HIERARCHY.keys())
+    return _MAIN_CATEGORIES
 
-def get_subcategories(main_category: str) -> List[str]:
+def get_subcategories(main_category: str) -> Tuple[str, ...]:
     """Get subcategories for a main category"""
-    if main_category in TOPIC_HIERARCHY:
-        return list(TOPIC_HIERARCHY[main_category].keys())
-    return []
+    return _SUBCATEGORIES.get(main_category, ())
 
-def get_specific_topics(main_category: str, subcategory: str) -> List[str]:
+def get_specific_topics(main_category: str, subcategory: str) -> Tuple[str, ...]:
     """Get specific topics for a subcategory"""
-    if main_category in TOPIC_HIERARCHY:
-        category_data = TOPIC_HIERARCHY[main_category]
-        if subcategory in category_data:
-            sub_data = category_data[subcategory]
-            if isinstance(sub_data, dict):
-                return list(sub_data.keys())
-            elif isinstance(sub_data, list):
-                return sub_data
-    return []
+    return _SPECIFIC_TOPICS.get((main_category, subcategory), ())
 
-def get_detailed_topics(main_category: str, subcategory: str, specific: str) -> List[str]:
+def get_detailed_topics(main_category: str, subcategory: str, specific: str) -> Tuple[str, ...]:
     """Get detailed topics for a specific selection"""
-    if main_category in TOPIC_HIERARCHY:
-        category_data = TOPIC_HIERARCHY[main_category]
-        if subcategory in category_data:
-            sub_data = category_data[subcategory]
-            if isinstance(sub_data, dict) and specific in sub_data:
-                return sub_data[specific]
-    return []
+    return _DETAILED_TOPICS.get((main_category, subcategory, specific), ())
 
+@lru_cache(maxsize=None)
 def build_topic_query(main_category: str, subcategory: str = "ALL", 
                       specific: str = None, detailed: str = None) -> str:
     """Build a comprehensive topic query string for agents"""
@@ -139,7 +147,8 @@ def build_topic_query(main_category: str, subcategory: str = "ALL",
     
     return " - ".join(parts)
 
-def get_search_keywords(main_category: str, subcategory: str = "ALL") -> List[str]:
+@lru_cache(maxsize=None)
+def get_search_keywords(main_category: str, subcategory: str = "ALL") -> Tuple[str, ...]:
     """Get relevant search keywords based on selection"""
     keywords = ["US healthcare", "2024", "2025", "latest", "trending"]
     
@@ -168,7 +177,7 @@ def get_search_keywords(main_category: str, subcategory: str = "ALL") -> List[st
     if subcategory in subcategory_keywords:
         keywords.extend(subcategory_keywords[subcategory])
     
-    return keywords
+    return tuple(keywords)
 
 # SEO Configuration
 SEO_CONFIG = {
@@ -0,0 +1,112 @@
+"""
+SEO Examiner report parsing: early FAIL must not lose the checklist or
+recommendations
+"""
+
+import asyncio
+import os
+import sys
+import types
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents import HealthcareAgentOrchestrator, StreamingSEOValidationParser
+
+
+# Examiner prompt order: PASS_STATUS comes before the checklist and advice
+FAILING_REPORT = """---
+OVERALL_SCORE: 40/100
+---
+CATEGORY_SCORES:
+- Keyword Usage: 8/20
+- Heading Structure: 6/15
+---
+PASS_STATUS: FAIL
+---
+VALIDATION_CHECKLIST:
+✓ Primary keyword in title
+✗ 5+ H2 headings
+✗ Word count >= 1500
+---
+RECOMMENDATIONS:
+1. Add at least three more H2 sections
+2. Expand the article past 1500 words
+---
+Anything after this point is never needed
+"""
+
+
+class _Stream:
+    """Minimal async chat stream that records whether it was closed early"""
+
+    def __init__(self, text: str, size: int = 5):
+        self.chunks = [text[i:i + size] for i in range(0, len(text), size)]
+        self.sent = 0
+        self.closed = False
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            self.sent += 1
+            yield types.SimpleNamespace(
+                usage=None,
+                choices=[types.SimpleNamespace(delta=types.SimpleNamespace(content=chunk))]
+            )
+
+    async def close(self):
+        self.closed = True
+
+
+class StreamingParserTest(unittest.TestCase):
+
+    def test_early_fail_waits_for_recommendations(self):
+        parser = StreamingSEOValidationParser()
+        head, _, tail = FAILING_REPORT.partition("RECOMMENDATIONS:")
+        parser.feed(head)
+        self.assertFalse(parser.early_fail)
+        parser.feed("RECOMMENDATIONS:" + tail)
+        self.assertTrue(parser.early_fail)
+
+    def test_early_fail_needs_an_overall_score(self):
+        parser = StreamingSEOValidationParser()
+        parser.feed("PASS_STATUS: FAIL\nRECOMMENDATIONS:\n1. Fix it\n---\n")
+        self.assertFalse(parser.early_fail)
+
+    def test_score_line_variants(self):
+        for line in ("Overall score: 65/100", "**OVERALL_SCORE:** 65/100"):
+            parser = StreamingSEOValidationParser()
+            parser.feed(line + "\n")
+            self.assertEqual(parser.finish().overall_score, 65.0)
+
+
+class StreamSEOReviewTest(unittest.TestCase):
+
+    def test_checklist_and_recommendations_survive_early_fail(self):
+        stream = _Stream(FAILING_REPORT)
+
+        async def create(**params):
+            return stream
+
+        orchestrator = HealthcareAgentOrchestrator()
+        orchestrator.openai_client = types.SimpleNamespace(
+            chat=types.SimpleNamespace(completions=types.SimpleNamespace(create=create))
+        )
+        validation = asyncio.run(orchestrator._stream_seo_review("# Article"))
+
+        self.assertTrue(stream.closed)
+        self.assertLess(stream.sent, len(stream.chunks))
+        self.assertFalse(validation.pass_status)
+        self.assertEqual(validation.overall_score, 40.0)
+        self.assertEqual(validation.validation_checklist, {
+            "Primary keyword in title": True,
+            "5+ H2 headings": False,
+            "Word count >= 1500": False
+        })
+        self.assertEqual(validation.recommendations, [
+            "Add at least three more H2 sections",
+            "Expand the article past 1500 words"
+        ])
+
+
+if __name__ == "__main__":
+    unittest.main()
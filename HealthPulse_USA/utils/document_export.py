@@ -3,27 +3,82 @@ Document Generation Utilities
 Handles export to PDF, DOCX, and TXT formats
 """
 
+import importlib.util
 import io
 import re
 import os
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime
 
-# Document generation libraries
-try:
-    from docx import Document
-    from docx.shared import Inches, Pt, RGBColor
-    from docx.enum.text import WD_ALIGN_PARAGRAPH
-    from docx.enum.style import WD_STYLE_TYPE
-    DOCX_AVAILABLE = True
-except ImportError:
-    DOCX_AVAILABLE = False
+# Document generation libraries; python-docx (and lxml) and fpdf are only
+# imported by the export that needs them
+DOCX_AVAILABLE = importlib.util.find_spec("docx") is not None
+PDF_AVAILABLE = importlib.util.find_spec("fpdf") is not None
+
+# Markdown cleanup, compiled once for every export
+_HEADER_RE = re.compile(r'^#{1,6}\s+', re.MULTILINE)
+_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_ITALIC_RE = re.compile(r'\*(.+?)\*')
+_LINK_RE = re.compile(r'\[(.+?)\]\(.+?\)')
+_BLANK_LINES_RE = re.compile(r'\n{3,}')
+_BOLD_SPLIT_RE = re.compile(r'(\*\*.*?\*\*)')
+_NUMBER_PREFIX_RE = re.compile(r'^\d+[\.\)]\s*')
+_DIGITS = frozenset('0123456789')
+
+# PDF heading level -> (line height, font size, RGB color, space before, space after)
+_PDF_HEADINGS = {
+    1: (7, 14, (0, 51, 102), 5, 2),
+    2: (6, 12, (0, 76, 153), 4, 2),
+    3: (5, 11, (51, 102, 153), 3, 1),
+}
+
+# DOCX heading level -> RGB color, applied to the template's heading styles
+_DOCX_HEADING_COLORS = {
+    1: (0, 51, 102),
+    2: (0, 76, 153),
+    3: (51, 102, 153),
+}
+
+# Rule lines for the TXT and DOCX layouts
+_TXT_RULE = "=" * 70
+_TXT_SUBRULE = "-" * 70
+_DOCX_RULE = "_" * 60
 
-try:
-    from fpdf import FPDF
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
+# Download filename cleanup
+_FILENAME_BAD_RE = re.compile(r'[^\w\s-]')
+_FILENAME_WS_RE = re.compile(r'\s+')
+
+
+# Unicode characters that standard PDF fonts can't render -> ASCII equivalents,
+# applied in one str.translate pass
+_PDF_REPLACEMENTS = str.maketrans({
+    '•': '-',      # Bullet point
+    '–': '-',      # En dash
+    '—': '-',      # Em dash
+    '\u2018': "'",  # Left single quote
+    '\u2019': "'",  # Right single quote
+    '\u201c': '"',  # Left double quote
+    '\u201d': '"',  # Right double quote
+    '…': '...',    # Ellipsis
+    '©': '(c)',    # Copyright
+    '®': '(R)',    # Registered
+    '™': '(TM)',   # Trademark
+    '°': ' deg',   # Degree
+    '±': '+/-',    # Plus-minus
+    '×': 'x',      # Multiplication
+    '÷': '/',      # Division
+    '≤': '<=',     # Less than or equal
+    '≥': '>=',     # Greater than or equal
+    '≠': '!=',     # Not equal
+    '→': '->',     # Right arrow
+    '←': '<-',     # Left arrow
+    '✓': '[x]',    # Checkmark
+    '✗': '[ ]',    # X mark
+    '★': '*',      # Star
+    '✅': '[PASS]', # Green checkmark
+    '❌': '[FAIL]', # Red X
+})
 
 
 def sanitize_text_for_pdf(text: str) -> str:
@@ -31,48 +86,48 @@ def sanitize_text_for_pdf(text: str) -> str:
     Replace Unicode characters that aren't supported by standard PDF fonts
     with ASCII equivalents
     """
-    replacements = {
-        '•': '-',      # Bullet point
-        '–': '-',      # En dash
-        '—': '-',      # Em dash
-        ''': "'",      # Left single quote
-        ''': "'",      # Right single quote
-        '"': '"',      # Left double quote
-        '"': '"',      # Right double quote
-        '…': '...',    # Ellipsis
-        '©': '(c)',    # Copyright
-        '®': '(R)',    # Registered
-        '™': '(TM)',   # Trademark
-        '°': ' deg',   # Degree
-        '±': '+/-',    # Plus-minus
-        '×': 'x',      # Multiplication
-        '÷': '/',      # Division
-        '≤': '<=',     # Less than or equal
-        '≥': '>=',     # Greater than or equal
-        '≠': '!=',     # Not equal
-        '→': '->',     # Right arrow
-        '←': '<-',     # Left arrow
-        '✓': '[x]',    # Checkmark
-        '✗': '[ ]',    # X mark
-        '★': '*',      # Star
-        '✅': '[PASS]', # Green checkmark
-        '❌': '[FAIL]', # Red X
-    }
-    
-    for unicode_char, ascii_char in replacements.items():
-        text = text.replace(unicode_char, ascii_char)
+    text = text.translate(_PDF_REPLACEMENTS)
+    if text.isascii():
+        return text
     
     # Remove any remaining non-ASCII characters
-    text = text.encode('ascii', 'ignore').decode('ascii')
+    return text.encode('ascii', 'ignore').decode('ascii')
+
+
+@lru_cache(maxsize=1)
+def _docx_template() -> bytes:
+    """Saved blank document with the title and heading styles configured
+    
+    Built on the first DOCX export; each export then opens a copy instead of
+    styling a fresh Document.
+    """
+    from docx import Document
+    from docx.shared import Pt, RGBColor
     
-    return text
+    doc = Document()
+    styles = doc.styles
+    
+    # Title style
+    title_style = styles['Title']
+    title_style.font.size = Pt(24)
+    title_style.font.bold = True
+    title_style.font.color.rgb = RGBColor(*_DOCX_HEADING_COLORS[1])
+    
+    # Heading styles
+    for level, rgb in _DOCX_HEADING_COLORS.items():
+        styles[f'Heading {level}'].font.color.rgb = RGBColor(*rgb)
+    
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
 
 
 class ArticleExporter:
     """Exports articles to various formats"""
     
     def __init__(self, title: str, content: str, meta_description: str = "", 
-                 seo_score: float = 0.0, keywords: list = None):
+                 seo_score: float = 0.0, keywords: list = None,
+                 generated: Optional[datetime] = None):
         """
         Initialize the exporter with article data
         
@@ -82,121 +137,113 @@ class ArticleExporter:
             meta_description: SEO meta description
             seo_score: SEO validation score
             keywords: List of keywords
+            generated: When the article was generated (defaults to now)
         """
         self.title = title
         self.content = content
         self.meta_description = meta_description
         self.seo_score = seo_score
         self.keywords = keywords or []
-        self.generation_date = datetime.now().strftime("%B %d, %Y")
+        self.generation_date = (generated or datetime.now()).strftime("%B %d, %Y")
     
     def _clean_markdown(self, text: str) -> str:
         """Remove markdown formatting for plain text"""
         # Remove headers
-        text = re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)
+        text = _HEADER_RE.sub('', text)
         # Remove bold/italic
-        text = re.sub(r'\*\*(.+?)\*\*', r'\1', text)
-        text = re.sub(r'\*(.+?)\*', r'\1', text)
+        text = _BOLD_RE.sub(r'\1', text)
+        text = _ITALIC_RE.sub(r'\1', text)
         # Remove links
-        text = re.sub(r'\[(.+?)\]\(.+?\)', r'\1', text)
+        text = _LINK_RE.sub(r'\1', text)
         # Clean up extra whitespace
-        text = re.sub(r'\n{3,}', '\n\n', text)
+        text = _BLANK_LINES_RE.sub('\n\n', text)
         return text.strip()
     
     def _parse_markdown_sections(self, content: str) -> list:
         """Parse markdown content into sections with headers"""
         sections = []
-        current_section = {"level": 0, "title": "", "content": ""}
+        level, title, lines = 0, "", []
         
         for line in content.split('\n'):
-            if line.startswith('# '):
-                if current_section["content"] or current_section["title"]:
-                    sections.append(current_section)
-                current_section = {"level": 1, "title": line[2:].strip(), "content": ""}
-            elif line.startswith('## '):
-                if current_section["content"] or current_section["title"]:
-                    sections.append(current_section)
-                current_section = {"level": 2, "title": line[3:].strip(), "content": ""}
-            elif line.startswith('### '):
-                if current_section["content"] or current_section["title"]:
-                    sections.append(current_section)
-                current_section = {"level": 3, "title": line[4:].strip(), "content": ""}
+            # "# ", "## " and "### " open a new section
+            hashes = len(line) - len(line.lstrip('#'))
+            if 1 <= hashes <= 3 and line[hashes:hashes + 1] == ' ':
+                if lines or title:
+                    sections.append({"level": level, "title": title, "content": "\n".join(lines) + "\n" if lines else ""})
+                level, title, lines = hashes, line[hashes + 1:].strip(), []
             else:
-                current_section["content"] += line + "\n"
+                lines.append(line)
         
-        if current_section["content"] or current_section["title"]:
-            sections.append(current_section)
+        if lines or title:
+            sections.append({"level": level, "title": title, "content": "\n".join(lines) + "\n" if lines else ""})
         
         return sections
     
     def export_to_txt(self) -> bytes:
         """Export article to plain text format"""
-        output = io.StringIO()
-        
         # Header
-        output.write("=" * 70 + "\n")
-        output.write(f"  {self.title}\n")
-        output.write("=" * 70 + "\n\n")
+        parts = [
+            _TXT_RULE + "\n",
+            f"  {self.title}\n",
+            _TXT_RULE + "\n\n",
+        ]
         
         # Meta information
-        output.write(f"Generated: {self.generation_date}\n")
-        output.write(f"SEO Score: {self.seo_score}%\n")
+        parts.append(f"Generated: {self.generation_date}\n")
+        parts.append(f"SEO Score: {self.seo_score}%\n")
         if self.keywords:
-            output.write(f"Keywords: {', '.join(self.keywords)}\n")
-        output.write("\n" + "-" * 70 + "\n\n")
+            parts.append(f"Keywords: {', '.join(self.keywords)}\n")
+        parts.append("\n" + _TXT_SUBRULE + "\n\n")
         
         # Meta description
         if self.meta_description:
-            output.write("META DESCRIPTION:\n")
-            output.write(self.meta_description + "\n\n")
-            output.write("-" * 70 + "\n\n")
+            parts.append("META DESCRIPTION:\n")
+            parts.append(self.meta_description + "\n\n")
+            parts.append(_TXT_SUBRULE + "\n\n")
         
         # Content
-        output.write(self._clean_markdown(self.content))
+        parts.append(self._clean_markdown(self.content))
         
         # Footer
-        output.write("\n\n" + "=" * 70 + "\n")
-        output.write("Generated by HealthPulse USA - Multi-Agent Healthcare Content System\n")
-        output.write("=" * 70 + "\n")
+        parts.append("\n\n" + _TXT_RULE + "\n")
+        parts.append("Generated by HealthPulse USA - Multi-Agent Healthcare Content System\n")
+        parts.append(_TXT_RULE + "\n")
         
-        return output.getvalue().encode('utf-8')
+        return "".join(parts).encode('utf-8')
     
     def export_to_docx(self) -> Optional[bytes]:
         """Export article to DOCX format"""
         if not DOCX_AVAILABLE:
             return None
         
-        doc = Document()
+        from docx import Document
+        from docx.shared import Inches, Pt, RGBColor
+        from docx.enum.text import WD_ALIGN_PARAGRAPH
         
-        # Set up styles
-        styles = doc.styles
-        
-        # Title style
-        title_style = styles['Title']
-        title_style.font.size = Pt(24)
-        title_style.font.bold = True
-        title_style.font.color.rgb = RGBColor(0, 51, 102)
+        doc = Document(io.BytesIO(_docx_template()))
+        gray = RGBColor(128, 128, 128)
+        spacing = Pt(12)
         
         # Add title
         title_para = doc.add_paragraph(self.title, style='Title')
         title_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         
-        # Add meta information
-        doc.add_paragraph()
+        # Add meta information; spacing replaces empty spacer paragraphs
         meta_para = doc.add_paragraph()
+        meta_para.paragraph_format.space_before = spacing
         meta_run = meta_para.add_run(f"Generated: {self.generation_date} | SEO Score: {self.seo_score}%")
         meta_run.font.size = Pt(10)
         meta_run.font.italic = True
-        meta_run.font.color.rgb = RGBColor(128, 128, 128)
+        meta_run.font.color.rgb = gray
         meta_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
         
         # Add horizontal line
-        doc.add_paragraph("_" * 60)
+        doc.add_paragraph(_DOCX_RULE)
         
         # Add meta description
         if self.meta_description:
-            doc.add_paragraph()
             meta_heading = doc.add_paragraph()
+            meta_heading.paragraph_format.space_before = spacing
             meta_heading_run = meta_heading.add_run("Meta Description")
             meta_heading_run.bold = True
             meta_heading_run.font.size = Pt(11)
@@ -206,8 +253,7 @@ class ArticleExporter:
             for run in meta_content.runs:
                 run.font.italic = True
                 run.font.size = Pt(10)
-            
-            doc.add_paragraph()
+            meta_content.paragraph_format.space_after = spacing
         
         # Add keywords
         if self.keywords:
@@ -215,22 +261,14 @@ class ArticleExporter:
             keywords_run = keywords_para.add_run(f"Keywords: {', '.join(self.keywords)}")
             keywords_run.font.size = Pt(10)
             keywords_run.font.color.rgb = RGBColor(0, 102, 153)
-            doc.add_paragraph()
+            keywords_para.paragraph_format.space_after = spacing
         
         # Parse and add content sections
         sections = self._parse_markdown_sections(self.content)
         
         for section in sections:
-            if section["title"]:
-                if section["level"] == 1:
-                    heading = doc.add_heading(section["title"], level=1)
-                    heading.runs[0].font.color.rgb = RGBColor(0, 51, 102)
-                elif section["level"] == 2:
-                    heading = doc.add_heading(section["title"], level=2)
-                    heading.runs[0].font.color.rgb = RGBColor(0, 76, 153)
-                elif section["level"] == 3:
-                    heading = doc.add_heading(section["title"], level=3)
-                    heading.runs[0].font.color.rgb = RGBColor(51, 102, 153)
+            if section["title"] and section["level"] in _DOCX_HEADING_COLORS:
+                doc.add_heading(section["title"], level=section["level"])
             
             # Process content
             content = section["content"].strip()
@@ -249,21 +287,25 @@ class ArticleExporter:
                                 elif line.strip():
                                     doc.add_paragraph(line.strip())
                         # Check for numbered lists
-                        elif para_text[0].isdigit() and para_text[1:3] in ['. ', ') ']:
+                        elif para_text[0] in _DIGITS and para_text[1:3] in ('. ', ') '):
                             lines = para_text.split('\n')
                             for line in lines:
-                                if line.strip() and line.strip()[0].isdigit():
+                                line = line.strip()
+                                if line and line[0] in _DIGITS:
                                     # Extract text after number
-                                    list_text = re.sub(r'^\d+[\.\)]\s*', '', line.strip())
+                                    list_text = _NUMBER_PREFIX_RE.sub('', line)
                                     para = doc.add_paragraph(list_text, style='List Number')
-                                elif line.strip():
-                                    doc.add_paragraph(line.strip())
+                                elif line:
+                                    doc.add_paragraph(line)
                         else:
                             # Regular paragraph - handle bold text
                             para = doc.add_paragraph()
+                            text_one_line = para_text.replace('\n', ' ')
+                            if '**' not in text_one_line:
+                                para.add_run(text_one_line)
+                                continue
                             # Split on bold markers
-                            parts = re.split(r'(\*\*.*?\*\*)', para_text.replace('\n', ' '))
-                            for part in parts:
+                            for part in _BOLD_SPLIT_RE.split(text_one_line):
                                 if part.startswith('**') and part.endswith('**'):
                                     run = para.add_run(part[2:-2])
                                     run.bold = True
@@ -271,13 +313,12 @@ class ArticleExporter:
                                     para.add_run(part)
         
         # Add footer
-        doc.add_paragraph()
-        doc.add_paragraph("_" * 60)
+        doc.add_paragraph(_DOCX_RULE).paragraph_format.space_before = spacing
         footer = doc.add_paragraph()
         footer_run = footer.add_run("Generated by HealthPulse USA - Multi-Agent Healthcare Content System")
         footer_run.font.size = Pt(9)
         footer_run.font.italic = True
-        footer_run.font.color.rgb = RGBColor(128, 128, 128)
+        footer_run.font.color.rgb = gray
         footer.alignment = WD_ALIGN_PARAGRAPH.CENTER
         
         # Save to bytes
@@ -291,6 +332,8 @@ class ArticleExporter:
         if not PDF_AVAILABLE:
             return None
         
+        from fpdf import FPDF
+        
         try:
             pdf = FPDF()
             pdf.set_auto_page_break(auto=True, margin=20)
@@ -339,52 +382,52 @@ class ArticleExporter:
             pdf.set_font('Helvetica', '', 10)
             pdf.set_text_color(0, 0, 0)
             
-            # Process content line by line
-            lines = safe_content.split('\n')
+            # Process content line by line. Consecutive body lines go out in
+            # one multi_cell (its text keeps their line breaks), and the body
+            # font is only restored when body text follows a heading.
+            body_lines = []
+            body_font = True
+            
+            def flush_body():
+                nonlocal body_font
+                if not body_lines:
+                    return
+                if not body_font:
+                    pdf.set_font('Helvetica', '', 10)
+                    pdf.set_text_color(0, 0, 0)
+                    body_font = True
+                pdf.multi_cell(0, 5, "\n".join(body_lines))
+                body_lines.clear()
             
-            for line in lines:
+            for line in safe_content.split('\n'):
                 line = line.strip()
                 
                 if not line:
+                    flush_body()
                     pdf.ln(3)
                     continue
                 
                 # Handle headers
-                if line.startswith('# '):
-                    pdf.ln(5)
-                    pdf.set_font('Helvetica', 'B', 14)
-                    pdf.set_text_color(0, 51, 102)
-                    header_text = line[2:].strip()[:70]
-                    pdf.multi_cell(0, 7, header_text)
-                    pdf.set_font('Helvetica', '', 10)
-                    pdf.set_text_color(0, 0, 0)
-                    pdf.ln(2)
-                elif line.startswith('## '):
-                    pdf.ln(4)
-                    pdf.set_font('Helvetica', 'B', 12)
-                    pdf.set_text_color(0, 76, 153)
-                    header_text = line[3:].strip()[:70]
-                    pdf.multi_cell(0, 6, header_text)
-                    pdf.set_font('Helvetica', '', 10)
-                    pdf.set_text_color(0, 0, 0)
-                    pdf.ln(2)
-                elif line.startswith('### '):
-                    pdf.ln(3)
-                    pdf.set_font('Helvetica', 'B', 11)
-                    pdf.set_text_color(51, 102, 153)
-                    header_text = line[4:].strip()[:70]
-                    pdf.multi_cell(0, 5, header_text)
-                    pdf.set_font('Helvetica', '', 10)
-                    pdf.set_text_color(0, 0, 0)
-                    pdf.ln(1)
+                hashes = len(line) - len(line.lstrip('#'))
+                heading = _PDF_HEADINGS.get(hashes) if line[hashes:hashes + 1] == ' ' else None
+                if heading:
+                    flush_body()
+                    height, size, color, space_before, space_after = heading
+                    pdf.ln(space_before)
+                    pdf.set_font('Helvetica', 'B', size)
+                    pdf.set_text_color(*color)
+                    pdf.multi_cell(0, height, line[hashes + 1:].strip()[:70])
+                    body_font = False
+                    pdf.ln(space_after)
                 elif line.startswith('- ') or line.startswith('* '):
-                    bullet_text = "  - " + line[2:].strip()
-                    pdf.multi_cell(0, 5, bullet_text)
-                elif line.startswith(('1.', '2.', '3.', '4.', '5.', '6.', '7.', '8.', '9.')):
-                    pdf.multi_cell(0, 5, "  " + line)
+                    body_lines.append("  - " + line[2:].strip())
+                elif len(line) > 1 and line[0] in _DIGITS and line[1] in '.)':
+                    body_lines.append("  " + line)
                 else:
                     # Regular paragraph
-                    pdf.multi_cell(0, 5, line)
+                    body_lines.append(line)
+            
+            flush_body()
             
             # Footer
             pdf.ln(10)
@@ -402,13 +445,13 @@ class ArticleExporter:
             return None
 
 
-def get_download_filename(title: str, format: str) -> str:
-    """Generate a clean filename for download"""
+def get_download_filename(title: str, format: str, generated: Optional[datetime] = None) -> str:
+    """Generate a clean filename for download, dated by generated (defaults to now)"""
     # Clean the title for filename use
-    clean_title = re.sub(r'[^\w\s-]', '', title)
-    clean_title = re.sub(r'\s+', '_', clean_title)
+    clean_title = _FILENAME_BAD_RE.sub('', title)
+    clean_title = _FILENAME_WS_RE.sub('_', clean_title)
     clean_title = clean_title[:50]  # Limit length
     
-    timestamp = datetime.now().strftime("%Y%m%d")
+    timestamp = (generated or datetime.now()).strftime("%Y%m%d")
     
     return f"HealthPulse_{clean_title}_{timestamp}.{format}"